@@ -1,12 +1,28 @@
 """Database operations for timer tool - self-contained."""
 
+import atexit
+import heapq
 import sqlite3
 import sys
 import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+# Try to import boto3 for S3 backups
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
 
 def get_app_dir() -> Path:
     """Get the application directory."""
@@ -16,24 +32,25 @@ def get_app_dir() -> Path:
         return Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process; later calls skip the mkdir."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def get_data_dir() -> Path:
     """Get the data directory (creates if needed)."""
-    data_dir = get_app_dir() / "data"
-    data_dir.mkdir(exist_ok=True)
-    return data_dir
+    return _ensure_dir(get_app_dir() / "data")
 
 
 def get_backups_dir() -> Path:
     """Get the backups directory (creates if needed)."""
-    backups_dir = get_data_dir() / "backups"
-    backups_dir.mkdir(exist_ok=True)
-    return backups_dir
+    return _ensure_dir(get_data_dir() / "backups")
 
 
 def backup_database(keep_count: int = 10) -> Optional[Path]:
     """Create a backup of the database, keeping only the last N backups. Returns backup path."""
-    import shutil
-
     db_path = get_db_path()
     if not db_path.exists():
         return None  # No database yet
@@ -49,19 +66,31 @@ def backup_database(keep_count: int = 10) -> Optional[Path]:
     backup_name = f"invoices_{timestamp}.db"
     backup_path = backups_dir / backup_name
 
-    # Copy the database
+    # Copy with SQLite's online backup API - consistent even mid-write
     try:
-        shutil.copy2(db_path, backup_path)
+        dst = sqlite3.connect(str(backup_path))
+        try:
+            get_connection().backup(dst, pages=1000, sleep=0.001)
+        finally:
+            dst.close()
     except Exception:
         return None  # Silently fail if backup fails
 
-    # Clean up old backups (keep only the most recent N)
-    backups = sorted(backups_dir.glob("invoices_*.db"), reverse=True)
-    for old_backup in backups[keep_count:]:
-        try:
-            old_backup.unlink()
-        except Exception:
-            pass  # Ignore deletion errors
+    # Clean up old backups (keep only the most recent N). Timestamped names
+    # sort chronologically, so the newest N are the lexically largest.
+    try:
+        with os.scandir(backups_dir) as entries:
+            backups = [e for e in entries
+                       if e.name.startswith("invoices_") and e.name.endswith(".db")]
+    except OSError:
+        return backup_path
+    keep = {e.name for e in heapq.nlargest(keep_count, backups, key=lambda e: e.name)}
+    for old_backup in backups:
+        if old_backup.name not in keep:
+            try:
+                os.unlink(old_backup.path)
+            except Exception:
+                pass  # Ignore deletion errors
 
     return backup_path
 
@@ -76,21 +105,26 @@ def _log_error(message: str):
         pass  # Can't even log, give up
 
 
+S3_UPLOAD_ATTEMPTS = 3
+
+
 def upload_to_s3(file_path: Path) -> bool:
     """Upload a file to S3. Returns True if successful."""
-    bucket = get_setting('s3_bucket', '')
-    region = get_setting('s3_region', '')
-    access_key = get_setting('s3_access_key', '')
-    secret_key = get_setting('s3_secret_key', '')
+    cfg = get_settings(['s3_bucket', 's3_region', 's3_access_key', 's3_secret_key'])
+    bucket = cfg.get('s3_bucket', '')
+    region = cfg.get('s3_region', '')
+    access_key = cfg.get('s3_access_key', '')
+    secret_key = cfg.get('s3_secret_key', '')
 
     if not all([bucket, region, access_key, secret_key]):
         _log_error(f"S3 not configured - bucket={bool(bucket)}, region={bool(region)}, access_key={bool(access_key)}, secret_key={bool(secret_key)}")
         return False
 
-    try:
-        import boto3
-        from botocore.config import Config
+    if not BOTO3_AVAILABLE:
+        _log_error("boto3 not installed")
+        return False
 
+    try:
         config = Config(
             region_name=region,
             s3={'use_accelerate_endpoint': False}
@@ -102,21 +136,38 @@ def upload_to_s3(file_path: Path) -> bool:
             config=config
         )
 
-        # Upload with the same filename
+        # Multipart with parallel parts once the backup passes 8MB
+        transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True
+        )
+
+        # Upload with the same filename, retrying with backoff
         s3_key = f"timertool-backups/{file_path.name}"
-        s3.upload_file(str(file_path), bucket, s3_key)
+        for attempt in range(1, S3_UPLOAD_ATTEMPTS + 1):
+            try:
+                s3.upload_file(str(file_path), bucket, s3_key, Config=transfer_config)
+                break
+            except Exception as e:
+                if attempt == S3_UPLOAD_ATTEMPTS:
+                    raise
+                _log_error(f"S3 upload attempt {attempt} failed, retrying: {type(e).__name__}: {e}")
+                time.sleep(2 ** attempt)
 
         # Clean up old S3 backups (keep last 10)
-        response = s3.list_objects_v2(Bucket=bucket, Prefix='timertool-backups/')
-        if 'Contents' in response:
-            objects = sorted(response['Contents'], key=lambda x: x['LastModified'], reverse=True)
-            for obj in objects[10:]:
-                s3.delete_object(Bucket=bucket, Key=obj['Key'])
+        objects = []
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix='timertool-backups/'):
+            objects.extend(page.get('Contents', []))
+        objects.sort(key=lambda x: x['LastModified'], reverse=True)
+        stale = [{'Key': obj['Key']} for obj in objects[10:]]
+        # One request per 1000 keys (the delete_objects limit)
+        for i in range(0, len(stale), 1000):
+            s3.delete_objects(Bucket=bucket, Delete={'Objects': stale[i:i + 1000], 'Quiet': True})
 
         return True
-    except ImportError as e:
-        _log_error(f"boto3 not installed: {e}")
-        return False
     except Exception as e:
         _log_error(f"S3 upload failed: {type(e).__name__}: {e}")
         return False
@@ -124,9 +175,7 @@ def upload_to_s3(file_path: Path) -> bool:
 
 def get_invoices_dir() -> Path:
     """Get the invoices directory (creates if needed)."""
-    invoices_dir = get_app_dir() / "invoices"
-    invoices_dir.mkdir(exist_ok=True)
-    return invoices_dir
+    return _ensure_dir(get_app_dir() / "invoices")
 
 
 def get_pdfs_dir() -> Path:
@@ -145,285 +194,632 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
+class _SharedConnection(sqlite3.Connection):
+    """Long-lived connection shared by every helper on one thread.
+
+    close() only discards an uncommitted transaction, so callers written
+    against the old open/close-per-call pattern don't tear it down.
+    """
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+    def _really_close(self):
+        super().close()
+
+
+# Applied once to every new connection. WAL lets the UI read while the timer
+# auto-saves, and synchronous=NORMAL skips the fsync on each commit (still
+# crash-safe in WAL mode).
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=268435456;
+"""
+
+_local = threading.local()
+_connections: List[_SharedConnection] = []
+_connections_lock = threading.Lock()
+_initialized_paths = set()
+_init_lock = threading.Lock()
+
+# Settings, business info and banking are read all over the app but only
+# change through their save functions, which invalidate entries here.
+# Keyed by (database path, kind, key); shared by all threads.
+_config_cache: Dict[tuple, object] = {}
+_config_cache_lock = threading.Lock()
+_config_cache_generation = 0
+config_cache_stats = {'hits': 0, 'misses': 0}
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(get_db_path())
+    """Get this thread's shared database connection (opened on first use).
+
+    Other modules must go through this rather than calling sqlite3.connect
+    themselves, so every connection gets the same pragmas.
+    """
+    conn = getattr(_local, 'conn', None)
+    # Fast path: DB_PATH is still the object this connection was opened for,
+    # so skip building and stringifying a Path on every call
+    if conn is not None and _local.db_path is DB_PATH:
+        return conn
+
+    db_path = get_db_path()
+    path = str(db_path)
+    if conn is not None:
+        if _local.path == path:
+            _local.db_path = db_path
+            return conn
+        # Database location changed (tests swap it out) - drop the old one
+        _discard_connection(conn)
+
+    conn = sqlite3.connect(path, factory=_SharedConnection, check_same_thread=False,
+                           cached_statements=256)
     conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    with _connections_lock:
+        _connections.append(conn)
+    _local.conn = conn
+    _local.path = path
+    _local.db_path = db_path
+
+    # Bring the schema up to date the first time each database is opened,
+    # instead of as a side effect of importing this module
+    if path not in _initialized_paths:
+        with _init_lock:
+            if path not in _initialized_paths:
+                _init_schema(conn)
+                _initialized_paths.add(path)
     return conn
 
 
-def init_db():
-    """Initialize all database tables."""
+def _cached_read(key: tuple, fetch):
+    """Memoize a read on this thread until the database changes.
+
+    The cache is dropped whenever this connection modifies rows
+    (total_changes) or another connection commits (data_version), so
+    writers never have to invalidate it themselves. Reads inside an open
+    transaction bypass it: they may see rows that are later rolled back,
+    and a rollback moves neither counter.
+    """
     conn = get_connection()
-    cursor = conn.cursor()
+    if conn.in_transaction:
+        return fetch()
+    stamp = (conn, conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0])
+    if getattr(_local, 'read_stamp', None) != stamp:
+        _local.read_cache = {}
+        _local.read_stamp = stamp
+    cache = _local.read_cache
+    if key not in cache:
+        cache[key] = fetch()
+    return cache[key]
+
+
+def _config_read(key: tuple, fetch):
+    """Return a cached settings/business/banking value, fetching on a miss."""
+    conn = get_connection()
+    cache_key = (_local.path,) + key
+    with _config_cache_lock:
+        if cache_key in _config_cache:
+            config_cache_stats['hits'] += 1
+            return _config_cache[cache_key]
+        config_cache_stats['misses'] += 1
+        generation = _config_cache_generation
+    value = fetch(conn)
+    with _config_cache_lock:
+        # Skip storing if a save landed while we were reading
+        if generation == _config_cache_generation:
+            _config_cache[cache_key] = value
+    return value
+
+
+def _config_invalidate(*key: str):
+    """Forget a cached config value; with no key, forget everything."""
+    global _config_cache_generation
+    with _config_cache_lock:
+        _config_cache_generation += 1
+        if key:
+            _config_cache.pop((_local.path,) + key, None)
+        else:
+            _config_cache.clear()
 
-    # Business info (from invoices system)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS business_info (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            company_name TEXT NOT NULL,
-            owner_name TEXT NOT NULL,
-            address TEXT NOT NULL,
-            city TEXT NOT NULL,
-            state TEXT NOT NULL,
-            zip TEXT NOT NULL,
-            phone TEXT NOT NULL,
-            email TEXT NOT NULL,
-            ein TEXT NOT NULL
-        )
-    """)
 
-    # Banking info - check for new columns
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS banking (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            bank_name TEXT NOT NULL,
-            routing_number TEXT NOT NULL,
-            account_number TEXT NOT NULL,
-            wire_instructions TEXT
-        )
-    """)
-    # Add international wire columns if not present
-    cursor.execute("PRAGMA table_info(banking)")
-    banking_cols = [row[1] for row in cursor.fetchall()]
-    if 'swift_code' not in banking_cols:
-        cursor.execute("ALTER TABLE banking ADD COLUMN swift_code TEXT")
-    if 'intl_wire_instructions' not in banking_cols:
-        cursor.execute("ALTER TABLE banking ADD COLUMN intl_wire_instructions TEXT")
-    if 'domestic_wire_instructions' not in banking_cols:
-        cursor.execute("ALTER TABLE banking ADD COLUMN domestic_wire_instructions TEXT")
-    if 'paypal_email' not in banking_cols:
-        cursor.execute("ALTER TABLE banking ADD COLUMN paypal_email TEXT")
-    if 'credit_card_instructions' not in banking_cols:
-        cursor.execute("ALTER TABLE banking ADD COLUMN credit_card_instructions TEXT")
-
-    # Clients table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS clients (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            contact_name TEXT,
-            bill_to TEXT,
-            address TEXT,
-            address2 TEXT,
-            city TEXT,
-            state TEXT,
-            zip TEXT,
-            email TEXT,
-            payment_preference TEXT,
-            hourly_rate REAL DEFAULT 0,
-            favorite INTEGER DEFAULT 0,
-            archived INTEGER DEFAULT 0,
-            track_activity INTEGER DEFAULT 1
-        )
-    """)
-    # Add columns if not present (for migration from old schema)
-    cursor.execute("PRAGMA table_info(clients)")
-    columns = [row[1] for row in cursor.fetchall()]
-    if 'hourly_rate' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN hourly_rate REAL DEFAULT 0")
-    if 'favorite' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN favorite INTEGER DEFAULT 0")
-    if 'archived' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN archived INTEGER DEFAULT 0")
-    if 'track_activity' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN track_activity INTEGER DEFAULT 1")
-    if 'capture_screenshots' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN capture_screenshots INTEGER DEFAULT 0")
-    if 'push_screenshots_remote' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN push_screenshots_remote INTEGER DEFAULT 0")
-    if 'screenshot_keep_local' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN screenshot_keep_local INTEGER DEFAULT 1")
-    if 'screenshot_remote_method' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN screenshot_remote_method TEXT")
-    if 'screenshot_unc_path' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN screenshot_unc_path TEXT")
-    if 'screenshot_unc_username' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN screenshot_unc_username TEXT")
-    if 'bill_to' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN bill_to TEXT")
-    if 'address2' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN address2 TEXT")
-    # Retainer billing columns
-    if 'retainer_enabled' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN retainer_enabled INTEGER DEFAULT 0")
-    if 'retainer_hours' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN retainer_hours REAL")
-    if 'retainer_rate' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN retainer_rate REAL")
-    if 'weekly_flat_rate_enabled' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN weekly_flat_rate_enabled INTEGER DEFAULT 0")
-    if 'weekly_flat_rate' not in columns:
-        cursor.execute("ALTER TABLE clients ADD COLUMN weekly_flat_rate REAL")
-
-    # Invoices (from invoices system)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS invoices (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            invoice_number TEXT UNIQUE NOT NULL,
-            client_id INTEGER NOT NULL,
-            date_issued TEXT NOT NULL,
-            due_date TEXT NOT NULL,
-            description TEXT NOT NULL,
-            billing_type TEXT NOT NULL,
-            rate REAL NOT NULL,
-            quantity REAL,
-            total REAL NOT NULL,
-            payment_terms TEXT NOT NULL,
-            payment_method TEXT NOT NULL,
-            status TEXT DEFAULT 'unpaid',
-            date_paid TEXT,
-            FOREIGN KEY (client_id) REFERENCES clients(id)
-        )
-    """)
-    # Add amount_paid column if not present
-    cursor.execute("PRAGMA table_info(invoices)")
-    inv_cols = [row[1] for row in cursor.fetchall()]
-    if 'amount_paid' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN amount_paid REAL DEFAULT 0")
-    # Retainer billing columns
-    if 'retainer_hours_applied' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN retainer_hours_applied REAL")
-    if 'overage_hours' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN overage_hours REAL")
-    if 'is_retainer_invoice' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN is_retainer_invoice INTEGER DEFAULT 0")
-    if 'period_start' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN period_start TEXT")
-    if 'period_end' not in inv_cols:
-        cursor.execute("ALTER TABLE invoices ADD COLUMN period_end TEXT")
-
-    # Invoice hours breakdown
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS invoice_hours (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            invoice_number TEXT NOT NULL,
-            work_date TEXT NOT NULL,
-            hours REAL NOT NULL,
-            FOREIGN KEY (invoice_number) REFERENCES invoices(invoice_number)
-        )
-    """)
+def _discard_connection(conn: _SharedConnection):
+    """Close a shared connection and forget about it."""
+    with _connections_lock:
+        if conn in _connections:
+            _connections.remove(conn)
+    conn._really_close()
 
-    # Time entries (timer-specific)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS time_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id INTEGER NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT,
-            duration_seconds INTEGER,
-            description TEXT,
-            entry_type TEXT DEFAULT 'stopwatch',
-            invoiced INTEGER DEFAULT 0,
-            invoice_number TEXT,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (client_id) REFERENCES clients(id)
-        )
-    """)
-    # Add activity tracking columns if not present
-    cursor.execute("PRAGMA table_info(time_entries)")
-    entry_cols = [row[1] for row in cursor.fetchall()]
-    if 'key_presses' not in entry_cols:
-        cursor.execute("ALTER TABLE time_entries ADD COLUMN key_presses INTEGER DEFAULT 0")
-    if 'mouse_clicks' not in entry_cols:
-        cursor.execute("ALTER TABLE time_entries ADD COLUMN mouse_clicks INTEGER DEFAULT 0")
-    if 'mouse_moves' not in entry_cols:
-        cursor.execute("ALTER TABLE time_entries ADD COLUMN mouse_moves INTEGER DEFAULT 0")
-
-    # Active timer state (crash recovery)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS active_timer (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            client_id INTEGER,
-            start_time TEXT,
-            last_save_time TEXT,
-            accumulated_seconds INTEGER DEFAULT 0
-        )
-    """)
 
-    # Screenshots (proof of work)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS screenshots (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id INTEGER NOT NULL,
-            time_entry_id INTEGER,
-            captured_at TEXT NOT NULL,
-            file_path TEXT NOT NULL,
-            FOREIGN KEY (client_id) REFERENCES clients(id),
-            FOREIGN KEY (time_entry_id) REFERENCES time_entries(id)
-        )
-    """)
+def close_connections():
+    """Close all shared connections. Registered to run at interpreter exit."""
+    with _connections_lock:
+        conns = list(_connections)
+        _connections.clear()
+    for conn in conns:
+        try:
+            conn._really_close()
+        except Exception:
+            pass
+    _local.__dict__.clear()
+    _config_invalidate()
 
-    # Retainer exemptions (weeks where retainer minimum is waived)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS retainer_exemptions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client_id INTEGER NOT NULL,
-            week_start TEXT NOT NULL,
-            reason TEXT,
-            created_at TEXT NOT NULL,
-            UNIQUE(client_id, week_start),
-            FOREIGN KEY (client_id) REFERENCES clients(id)
-        )
-    """)
 
-    # Settings
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS settings (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        )
-    """)
+@contextmanager
+def tx():
+    """Run several writes as one transaction on the shared connection.
 
-    # Insert default settings if not exist
-    defaults = {
-        'inactivity_timeout_minutes': '10',
-        'auto_save_interval_seconds': '30',
-    }
-    for key, value in defaults.items():
-        cursor.execute(
+    Pass the yielded connection as ``conn=`` to helpers that accept it; they
+    then skip their own commit. Rolls back if the block raises.
+
+    Raises RuntimeError if this thread's connection already has a
+    transaction open (uncommitted writes from elsewhere, or a nested tx()),
+    rather than silently folding those writes into this block.
+    """
+    conn = get_connection()
+    if conn.in_transaction:
+        raise RuntimeError("tx() started while a transaction is already open on this thread")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+atexit.register(close_connections)
+
+
+# Full schema for a new database. Every statement is idempotent.
+_SCHEMA_DDL = """
+    -- Business info (from invoices system)
+    CREATE TABLE IF NOT EXISTS business_info (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        company_name TEXT NOT NULL,
+        owner_name TEXT NOT NULL,
+        address TEXT NOT NULL,
+        city TEXT NOT NULL,
+        state TEXT NOT NULL,
+        zip TEXT NOT NULL,
+        phone TEXT NOT NULL,
+        email TEXT NOT NULL,
+        ein TEXT NOT NULL
+    );
+
+    -- Banking info
+    CREATE TABLE IF NOT EXISTS banking (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        bank_name TEXT NOT NULL,
+        routing_number TEXT NOT NULL,
+        account_number TEXT NOT NULL,
+        wire_instructions TEXT,
+        swift_code TEXT,
+        intl_wire_instructions TEXT,
+        domestic_wire_instructions TEXT,
+        paypal_email TEXT,
+        credit_card_instructions TEXT
+    );
+
+    -- Clients (keeps AUTOINCREMENT like time_entries: invoices, screenshot
+    -- folders and screenshots.time_entry_id can outlive a deleted row, so
+    -- those ids must never be reused)
+    CREATE TABLE IF NOT EXISTS clients (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        contact_name TEXT,
+        bill_to TEXT,
+        address TEXT,
+        address2 TEXT,
+        city TEXT,
+        state TEXT,
+        zip TEXT,
+        email TEXT,
+        payment_preference TEXT,
+        hourly_rate REAL DEFAULT 0,
+        favorite INTEGER DEFAULT 0,
+        archived INTEGER DEFAULT 0,
+        track_activity INTEGER DEFAULT 1,
+        capture_screenshots INTEGER DEFAULT 0,
+        push_screenshots_remote INTEGER DEFAULT 0,
+        screenshot_keep_local INTEGER DEFAULT 1,
+        screenshot_remote_method TEXT,
+        screenshot_unc_path TEXT,
+        screenshot_unc_username TEXT,
+        retainer_enabled INTEGER DEFAULT 0,
+        retainer_hours REAL,
+        retainer_rate REAL,
+        weekly_flat_rate_enabled INTEGER DEFAULT 0,
+        weekly_flat_rate REAL
+    );
+
+    -- Invoices (from invoices system)
+    CREATE TABLE IF NOT EXISTS invoices (
+        id INTEGER PRIMARY KEY,
+        invoice_number TEXT UNIQUE NOT NULL,
+        client_id INTEGER NOT NULL,
+        date_issued TEXT NOT NULL,
+        due_date TEXT NOT NULL,
+        description TEXT NOT NULL,
+        billing_type TEXT NOT NULL,
+        rate REAL NOT NULL,
+        quantity REAL,
+        total REAL NOT NULL,
+        payment_terms TEXT NOT NULL,
+        payment_method TEXT NOT NULL,
+        status TEXT DEFAULT 'unpaid',
+        date_paid TEXT,
+        amount_paid REAL DEFAULT 0,
+        retainer_hours_applied REAL,
+        overage_hours REAL,
+        is_retainer_invoice INTEGER DEFAULT 0,
+        period_start TEXT,
+        period_end TEXT,
+        FOREIGN KEY (client_id) REFERENCES clients(id)
+    );
+
+    -- Invoice hours breakdown (one row per invoice and day, clustered on that key)
+    CREATE TABLE IF NOT EXISTS invoice_hours (
+        invoice_number TEXT NOT NULL,
+        work_date TEXT NOT NULL,
+        hours REAL NOT NULL,
+        PRIMARY KEY (invoice_number, work_date),
+        FOREIGN KEY (invoice_number) REFERENCES invoices(invoice_number)
+    ) WITHOUT ROWID;
+
+    -- Time entries (timer-specific)
+    CREATE TABLE IF NOT EXISTS time_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        client_id INTEGER NOT NULL,
+        start_time TEXT NOT NULL,
+        end_time TEXT,
+        duration_seconds INTEGER,
+        description TEXT,
+        entry_type TEXT DEFAULT 'stopwatch',
+        invoiced INTEGER DEFAULT 0,
+        invoice_number TEXT,
+        created_at TEXT NOT NULL,
+        key_presses INTEGER DEFAULT 0,
+        mouse_clicks INTEGER DEFAULT 0,
+        mouse_moves INTEGER DEFAULT 0,
+        FOREIGN KEY (client_id) REFERENCES clients(id)
+    );
+
+    -- Active timer state (crash recovery)
+    CREATE TABLE IF NOT EXISTS active_timer (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        client_id INTEGER,
+        start_time TEXT,
+        last_save_time TEXT,
+        accumulated_seconds INTEGER DEFAULT 0
+    );
+
+    -- Screenshots (proof of work)
+    CREATE TABLE IF NOT EXISTS screenshots (
+        id INTEGER PRIMARY KEY,
+        client_id INTEGER NOT NULL,
+        time_entry_id INTEGER,
+        captured_at TEXT NOT NULL,
+        file_path TEXT NOT NULL,
+        FOREIGN KEY (client_id) REFERENCES clients(id),
+        FOREIGN KEY (time_entry_id) REFERENCES time_entries(id)
+    );
+
+    -- Retainer exemptions (weeks where retainer minimum is waived)
+    CREATE TABLE IF NOT EXISTS retainer_exemptions (
+        id INTEGER PRIMARY KEY,
+        client_id INTEGER NOT NULL,
+        week_start TEXT NOT NULL,
+        reason TEXT,
+        created_at TEXT NOT NULL,
+        UNIQUE(client_id, week_start),
+        FOREIGN KEY (client_id) REFERENCES clients(id)
+    );
+
+    -- Settings
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+
+    -- Per-client invoice rollups, kept current by the triggers in
+    -- _CLIENT_STATS_DDL so summaries read one row instead of joining
+    CREATE TABLE IF NOT EXISTS client_stats (
+        client_id INTEGER PRIMARY KEY,
+        invoiced_hours REAL NOT NULL DEFAULT 0,
+        paid_hours REAL NOT NULL DEFAULT 0,
+        invoiced_amount REAL NOT NULL DEFAULT 0,
+        paid_amount REAL NOT NULL DEFAULT 0
+    );
+"""
+
+# Indexes for the hot lookups. Run after the column migrations since some
+# indexed columns only exist on older databases once they've been added.
+_INDEX_DDL = """
+    -- Per-client date ranges (replaces idx_time_entries_client)
+    DROP INDEX IF EXISTS idx_time_entries_client;
+    CREATE INDEX IF NOT EXISTS idx_time_entries_client_start ON time_entries(client_id, start_time);
+    -- Only the unbilled backlog, which is what the invoice dialogs look for
+    CREATE INDEX IF NOT EXISTS idx_time_entries_uninvoiced ON time_entries(client_id, start_time)
+        WHERE invoiced = 0 AND duration_seconds IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_time_entries_invoice ON time_entries(invoice_number)
+        WHERE invoice_number IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_screenshots_client ON screenshots(client_id);
+    CREATE INDEX IF NOT EXISTS idx_screenshots_entry ON screenshots(time_entry_id);
+    -- invoice_hours' primary key already leads with invoice_number
+    DROP INDEX IF EXISTS idx_invoice_hours_invnum;
+    CREATE INDEX IF NOT EXISTS idx_invoices_client_status ON invoices(client_id, status);
+    -- Tax year summary: payments by date, amount_paid included so the
+    -- quarterly sums never touch the table
+    CREATE INDEX IF NOT EXISTS idx_invoices_date_paid ON invoices(date_paid, amount_paid)
+        WHERE amount_paid > 0;
+    -- Active client list: filter and ORDER BY answered from this small index
+    -- (replaces idx_clients_archived_fav)
+    DROP INDEX IF EXISTS idx_clients_archived_fav;
+    CREATE INDEX IF NOT EXISTS idx_clients_active ON clients(favorite DESC, company_name)
+        WHERE archived = 0;
+"""
+
+# Recompute one client's client_stats row from its invoices. {client} is an
+# SQL expression for the client id (NEW./OLD. columns inside triggers).
+_REFRESH_CLIENT_STATS = """
+        INSERT OR REPLACE INTO client_stats
+            (client_id, invoiced_hours, paid_hours, invoiced_amount, paid_amount)
+        SELECT {client},
+               COALESCE(SUM(CASE WHEN status != 'paid' THEN hours END), 0),
+               COALESCE(SUM(CASE WHEN status = 'paid' THEN hours END), 0),
+               COALESCE(SUM(CASE WHEN status != 'paid' THEN total END), 0),
+               COALESCE(SUM(CASE WHEN status = 'paid' THEN total END), 0)
+        FROM (
+            SELECT status, total,
+                   (SELECT SUM(hours) FROM invoice_hours ih
+                    WHERE ih.invoice_number = i.invoice_number) as hours
+            FROM invoices i
+            WHERE client_id = {client}
+        );"""
+_INVOICE_CLIENT = "(SELECT client_id FROM invoices WHERE invoice_number = {row}.invoice_number)"
+
+# Triggers are dropped and recreated so a migration always installs the
+# current definitions, then every client's row is rebuilt from scratch.
+_CLIENT_STATS_DDL = """
+    DROP TRIGGER IF EXISTS trg_invoices_stats_insert;
+    CREATE TRIGGER trg_invoices_stats_insert AFTER INSERT ON invoices BEGIN
+        {new_invoice}
+    END;
+    DROP TRIGGER IF EXISTS trg_invoices_stats_update;
+    CREATE TRIGGER trg_invoices_stats_update
+    AFTER UPDATE OF client_id, invoice_number, status, total ON invoices BEGIN
+        {old_invoice}
+        {new_invoice}
+    END;
+    DROP TRIGGER IF EXISTS trg_invoices_stats_delete;
+    CREATE TRIGGER trg_invoices_stats_delete AFTER DELETE ON invoices BEGIN
+        {old_invoice}
+    END;
+    DROP TRIGGER IF EXISTS trg_invoice_hours_stats_insert;
+    CREATE TRIGGER trg_invoice_hours_stats_insert AFTER INSERT ON invoice_hours
+    WHEN {new_hours} IS NOT NULL BEGIN
+        {new_hours_refresh}
+    END;
+    DROP TRIGGER IF EXISTS trg_invoice_hours_stats_update;
+    CREATE TRIGGER trg_invoice_hours_stats_update AFTER UPDATE ON invoice_hours
+    WHEN {new_hours} IS NOT NULL BEGIN
+        {new_hours_refresh}
+    END;
+    DROP TRIGGER IF EXISTS trg_invoice_hours_stats_delete;
+    CREATE TRIGGER trg_invoice_hours_stats_delete AFTER DELETE ON invoice_hours
+    WHEN {old_hours} IS NOT NULL BEGIN
+        {old_hours_refresh}
+    END;
+
+    DELETE FROM client_stats;
+    INSERT INTO client_stats (client_id, invoiced_hours, paid_hours, invoiced_amount, paid_amount)
+    SELECT client_id,
+           COALESCE(SUM(CASE WHEN status != 'paid' THEN hours END), 0),
+           COALESCE(SUM(CASE WHEN status = 'paid' THEN hours END), 0),
+           COALESCE(SUM(CASE WHEN status != 'paid' THEN total END), 0),
+           COALESCE(SUM(CASE WHEN status = 'paid' THEN total END), 0)
+    FROM (
+        SELECT client_id, status, total,
+               (SELECT SUM(hours) FROM invoice_hours ih
+                WHERE ih.invoice_number = i.invoice_number) as hours
+        FROM invoices i
+    )
+    GROUP BY client_id;
+""".format(
+    new_invoice=_REFRESH_CLIENT_STATS.format(client="NEW.client_id"),
+    old_invoice=_REFRESH_CLIENT_STATS.format(client="OLD.client_id"),
+    new_hours=_INVOICE_CLIENT.format(row="NEW"),
+    old_hours=_INVOICE_CLIENT.format(row="OLD"),
+    new_hours_refresh=_REFRESH_CLIENT_STATS.format(client=_INVOICE_CLIENT.format(row="NEW")),
+    old_hours_refresh=_REFRESH_CLIENT_STATS.format(client=_INVOICE_CLIENT.format(row="OLD")),
+)
+
+# Data fixes so queries can compare plain columns instead of COALESCE()
+# wrappers (which keep SQLite from using the indexes above).
+_BACKFILL_DML = """
+    UPDATE clients SET
+        hourly_rate = COALESCE(hourly_rate, 0),
+        favorite = COALESCE(favorite, 0),
+        archived = COALESCE(archived, 0),
+        track_activity = COALESCE(track_activity, 1),
+        capture_screenshots = COALESCE(capture_screenshots, 0),
+        push_screenshots_remote = COALESCE(push_screenshots_remote, 0),
+        screenshot_keep_local = COALESCE(screenshot_keep_local, 1),
+        retainer_enabled = COALESCE(retainer_enabled, 0),
+        weekly_flat_rate_enabled = COALESCE(weekly_flat_rate_enabled, 0)
+    WHERE hourly_rate IS NULL OR favorite IS NULL OR archived IS NULL
+       OR track_activity IS NULL OR capture_screenshots IS NULL
+       OR push_screenshots_remote IS NULL OR screenshot_keep_local IS NULL
+       OR retainer_enabled IS NULL OR weekly_flat_rate_enabled IS NULL;
+"""
+
+# Columns added after a table was first released. New databases get them
+# from _SCHEMA_DDL; older ones have them ALTERed in.
+_ADDED_COLUMNS = {
+    'banking': [
+        ('swift_code', 'TEXT'),
+        ('intl_wire_instructions', 'TEXT'),
+        ('domestic_wire_instructions', 'TEXT'),
+        ('paypal_email', 'TEXT'),
+        ('credit_card_instructions', 'TEXT'),
+    ],
+    'clients': [
+        ('hourly_rate', 'REAL DEFAULT 0'),
+        ('favorite', 'INTEGER DEFAULT 0'),
+        ('archived', 'INTEGER DEFAULT 0'),
+        ('track_activity', 'INTEGER DEFAULT 1'),
+        ('capture_screenshots', 'INTEGER DEFAULT 0'),
+        ('push_screenshots_remote', 'INTEGER DEFAULT 0'),
+        ('screenshot_keep_local', 'INTEGER DEFAULT 1'),
+        ('screenshot_remote_method', 'TEXT'),
+        ('screenshot_unc_path', 'TEXT'),
+        ('screenshot_unc_username', 'TEXT'),
+        ('bill_to', 'TEXT'),
+        ('address2', 'TEXT'),
+        # Retainer billing columns
+        ('retainer_enabled', 'INTEGER DEFAULT 0'),
+        ('retainer_hours', 'REAL'),
+        ('retainer_rate', 'REAL'),
+        ('weekly_flat_rate_enabled', 'INTEGER DEFAULT 0'),
+        ('weekly_flat_rate', 'REAL'),
+    ],
+    'invoices': [
+        ('amount_paid', 'REAL DEFAULT 0'),
+        # Retainer billing columns
+        ('retainer_hours_applied', 'REAL'),
+        ('overage_hours', 'REAL'),
+        ('is_retainer_invoice', 'INTEGER DEFAULT 0'),
+        ('period_start', 'TEXT'),
+        ('period_end', 'TEXT'),
+    ],
+    'time_entries': [
+        # Activity tracking columns
+        ('key_presses', 'INTEGER DEFAULT 0'),
+        ('mouse_clicks', 'INTEGER DEFAULT 0'),
+        ('mouse_moves', 'INTEGER DEFAULT 0'),
+    ],
+}
+
+# Bump whenever the schema gains a table, column, index or backfill so
+# existing databases run the migration once more.
+SCHEMA_VERSION = 7
+
+
+def init_db():
+    """Initialize all database tables (no-op if the schema is current)."""
+    _init_schema(get_connection())
+
+
+def _init_schema(conn: sqlite3.Connection):
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] == SCHEMA_VERSION:
+        return
+
+    # All DDL goes through one executescript call inside one transaction
+    rebuild_before, rebuild_after = _invoice_hours_rebuild_ddl(cursor)
+    script = ("BEGIN;\n" + rebuild_before + _SCHEMA_DDL + rebuild_after +
+              _missing_columns_ddl(cursor) + _BACKFILL_DML + _INDEX_DDL + _CLIENT_STATS_DDL)
+    with conn:
+        conn.executescript(script)
+
+        # Insert default settings if not exist
+        defaults = {
+            'inactivity_timeout_minutes': '10',
+            'auto_save_interval_seconds': '30',
+        }
+        cursor.executemany(
             "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
-            (key, value)
+            list(defaults.items())
         )
 
-    conn.commit()
-    conn.close()
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    _config_invalidate()
+
+
+def _invoice_hours_rebuild_ddl(cursor: sqlite3.Cursor) -> tuple:
+    """Statements to move an old rowid invoice_hours table to the keyed layout.
+
+    Returns (before, after): the old table is renamed before _SCHEMA_DDL
+    creates the new one, then copied across (merging duplicate days).
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'invoice_hours'")
+    row = cursor.fetchone()
+    if row is None or 'WITHOUT ROWID' in row[0].upper():
+        return '', ''
+    before = "ALTER TABLE invoice_hours RENAME TO invoice_hours_old;\n"
+    after = """
+    INSERT INTO invoice_hours (invoice_number, work_date, hours)
+        SELECT invoice_number, work_date, SUM(hours) FROM invoice_hours_old
+        GROUP BY invoice_number, work_date;
+    DROP TABLE invoice_hours_old;
+"""
+    return before, after
+
+
+def _missing_columns_ddl(cursor: sqlite3.Cursor) -> str:
+    """Build ALTER TABLE statements for columns an older database lacks."""
+    statements = []
+    for table, columns in _ADDED_COLUMNS.items():
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in cursor.fetchall()}
+        if not existing:
+            continue  # Table doesn't exist yet; _SCHEMA_DDL creates it complete
+        for name, decl in columns:
+            if name not in existing:
+                statements.append(f"ALTER TABLE {table} ADD COLUMN {name} {decl};")
+    return '\n'.join(statements)
 
 
 # === Settings ===
 
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
 def get_setting(key: str, default: str = '') -> str:
     """Get a setting value."""
+    def fetch(conn):
+        row = conn.execute(_SQL_GET_SETTING, (key,)).fetchone()
+        return row['value'] if row else None
+    value = _config_read(('setting', key), fetch)
+    return default if value is None else value
+
+
+def get_settings(keys: List[str]) -> Dict[str, str]:
+    """Get several settings in one query. Missing keys are left out."""
+    if not keys:
+        return {}
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    conn.close()
-    return row['value'] if row else default
+    placeholders = ','.join('?' * len(keys))
+    cursor.execute(f"SELECT key, value FROM settings WHERE key IN ({placeholders})", keys)
+    return {row['key']: row['value'] for row in cursor}
 
 
 def set_setting(key: str, value: str):
     """Set a setting value."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute(
-        "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-        (key, value)
-    )
+    cursor.execute(_SQL_SET_SETTING, (key, value))
     conn.commit()
-    conn.close()
+    _config_invalidate('setting', key)
 
 
 # === Business Info ===
 
 def get_business_info() -> Optional[Dict]:
     """Get business info or None if not set."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM business_info WHERE id = 1")
-    row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    def fetch(conn):
+        row = conn.execute("SELECT * FROM business_info WHERE id = 1").fetchone()
+        return dict(row) if row else None
+    info = _config_read(('business_info',), fetch)
+    return dict(info) if info else None
 
 
 def save_business_info(data: Dict):
@@ -438,19 +834,18 @@ def save_business_info(data: Dict):
           data['city'], data['state'], data['zip'], data['phone'],
           data['email'], data['ein']))
     conn.commit()
-    conn.close()
+    _config_invalidate('business_info')
 
 
 # === Banking ===
 
 def get_banking() -> Optional[Dict]:
     """Get banking info or None if not set."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM banking WHERE id = 1")
-    row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    def fetch(conn):
+        row = conn.execute("SELECT * FROM banking WHERE id = 1").fetchone()
+        return dict(row) if row else None
+    banking = _config_read(('banking',), fetch)
+    return dict(banking) if banking else None
 
 
 def save_banking(data: Dict):
@@ -470,134 +865,157 @@ def save_banking(data: Dict):
           data.get('paypal_email'),
           data.get('credit_card_instructions')))
     conn.commit()
-    conn.close()
+    _config_invalidate('banking')
 
 
 # === Clients ===
 
+_SQL_SELECT_CLIENTS = """
+    SELECT id, company_name, contact_name, email,
+           hourly_rate, payment_preference, favorite, archived,
+           track_activity, capture_screenshots,
+           push_screenshots_remote, screenshot_keep_local,
+           screenshot_remote_method, screenshot_unc_path, screenshot_unc_username,
+           retainer_enabled, retainer_hours, retainer_rate,
+           weekly_flat_rate_enabled, weekly_flat_rate,
+           -- name prefers contact over company; display_name shows both
+           COALESCE(NULLIF(contact_name, ''), NULLIF(company_name, ''), '') as name,
+           CASE WHEN TRIM(COALESCE(contact_name, '')) != '' AND TRIM(COALESCE(company_name, '')) != ''
+                THEN TRIM(contact_name) || ' (' || TRIM(company_name) || ')'
+                ELSE COALESCE(NULLIF(TRIM(contact_name), ''), TRIM(COALESCE(company_name, '')))
+           END as display_name
+    FROM clients
+"""
+_SQL_GET_CLIENT = _SQL_SELECT_CLIENTS + " WHERE id = ?"
+_SQL_TOGGLE_FAVORITE = """
+    UPDATE clients SET favorite = 1 - favorite
+    WHERE id = ? RETURNING favorite
+"""
+
+
 def get_clients(include_archived: bool = False) -> List[Dict]:
     """Get all clients. Favorites pinned at top."""
     conn = get_connection()
     cursor = conn.cursor()
-    query = """
-        SELECT id, company_name, contact_name, email,
-               COALESCE(hourly_rate, 0) as hourly_rate, payment_preference,
-               COALESCE(favorite, 0) as favorite, COALESCE(archived, 0) as archived,
-               COALESCE(track_activity, 1) as track_activity,
-               COALESCE(capture_screenshots, 0) as capture_screenshots,
-               COALESCE(push_screenshots_remote, 0) as push_screenshots_remote,
-               COALESCE(screenshot_keep_local, 1) as screenshot_keep_local,
-               screenshot_remote_method, screenshot_unc_path, screenshot_unc_username,
-               COALESCE(retainer_enabled, 0) as retainer_enabled,
-               retainer_hours, retainer_rate,
-               COALESCE(weekly_flat_rate_enabled, 0) as weekly_flat_rate_enabled,
-               weekly_flat_rate
-        FROM clients
-    """
+    query = _SQL_SELECT_CLIENTS
     if not include_archived:
-        query += " WHERE COALESCE(archived, 0) = 0"
-    query += " ORDER BY COALESCE(favorite, 0) DESC, COALESCE(company_name, contact_name)"
+        query += " WHERE archived = 0"
+    query += " ORDER BY favorite DESC, company_name"
     cursor.execute(query)
-    rows = cursor.fetchall()
-    clients = []
-    for row in rows:
-        client = dict(row)
-        # Display name: prefer contact_name, fall back to company_name
-        client['name'] = client['contact_name'] or client['company_name'] or ''
-        client['display_name'] = _format_client_display(client['contact_name'], client['company_name'])
-        clients.append(client)
-    conn.close()
-    return clients
-
-
-def _format_client_display(contact_name: str, company_name: str) -> str:
-    """Format client display name from contact and company."""
-    contact = (contact_name or '').strip()
-    company = (company_name or '').strip()
-    if contact and company:
-        return f"{contact} ({company})"
-    return contact or company or ''
+    return [dict(row) for row in cursor]
 
 
 def get_client(client_id: int) -> Optional[Dict]:
     """Get client by ID."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("""
-        SELECT id, company_name, contact_name, email,
-               COALESCE(hourly_rate, 0) as hourly_rate, payment_preference,
-               COALESCE(favorite, 0) as favorite, COALESCE(archived, 0) as archived,
-               COALESCE(track_activity, 1) as track_activity,
-               COALESCE(capture_screenshots, 0) as capture_screenshots,
-               COALESCE(push_screenshots_remote, 0) as push_screenshots_remote,
-               COALESCE(screenshot_keep_local, 1) as screenshot_keep_local,
-               screenshot_remote_method, screenshot_unc_path, screenshot_unc_username,
-               COALESCE(retainer_enabled, 0) as retainer_enabled,
-               retainer_hours, retainer_rate,
-               COALESCE(weekly_flat_rate_enabled, 0) as weekly_flat_rate_enabled,
-               weekly_flat_rate
-        FROM clients WHERE id = ?
-    """, (client_id,))
+    cursor.execute(_SQL_GET_CLIENT, (client_id,))
     row = cursor.fetchone()
-    conn.close()
-    if row:
-        client = dict(row)
-        client['name'] = client['contact_name'] or client['company_name'] or ''
-        client['display_name'] = _format_client_display(client['contact_name'], client['company_name'])
-        return client
-    return None
+    return dict(row) if row else None
 
 
-def toggle_client_favorite(client_id: int) -> bool:
+def toggle_client_favorite(client_id: int, conn: Optional[sqlite3.Connection] = None) -> bool:
     """Toggle client favorite status. Returns new status."""
-    conn = get_connection()
+    owns_tx = conn is None
+    conn = conn or get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(favorite, 0) FROM clients WHERE id = ?", (client_id,))
-    current = cursor.fetchone()[0]
-    new_val = 0 if current else 1
-    cursor.execute("UPDATE clients SET favorite = ? WHERE id = ?", (new_val, client_id))
-    conn.commit()
-    conn.close()
-    return bool(new_val)
+    cursor.execute(_SQL_TOGGLE_FAVORITE, (client_id,))
+    row = cursor.fetchone()
+    if owns_tx:
+        conn.commit()
+    if row is None:
+        raise ValueError(f"Client {client_id} not found")
+    return bool(row[0])
 
 
-def archive_client(client_id: int):
-    """Archive (soft delete) a client."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE clients SET archived = 1 WHERE id = ?", (client_id,))
-    conn.commit()
-    conn.close()
+def archive_client(client_id: int, conn: Optional[sqlite3.Connection] = None) -> bool:
+    """Archive (soft delete) a client. Returns True if the client exists."""
+    return _set_client_archived(client_id, 1, conn)
 
 
-def unarchive_client(client_id: int):
-    """Restore an archived client."""
-    conn = get_connection()
+def unarchive_client(client_id: int, conn: Optional[sqlite3.Connection] = None) -> bool:
+    """Restore an archived client. Returns True if the client exists."""
+    return _set_client_archived(client_id, 0, conn)
+
+
+def _set_client_archived(client_id: int, archived: int,
+                         conn: Optional[sqlite3.Connection] = None) -> bool:
+    """Set the archived flag in one statement, reporting whether a row matched."""
+    owns_tx = conn is None
+    conn = conn or get_connection()
     cursor = conn.cursor()
-    cursor.execute("UPDATE clients SET archived = 0 WHERE id = ?", (client_id,))
-    conn.commit()
-    conn.close()
+    cursor.execute("UPDATE clients SET archived = ? WHERE id = ? RETURNING archived",
+                   (archived, client_id))
+    row = cursor.fetchone()
+    if owns_tx:
+        conn.commit()
+    return row is not None
 
 
 def delete_client(client_id: int):
-    """Permanently delete a client (only if no time entries)."""
+    """Permanently delete a client (only if no time entries).
+
+    Raises ValueError if the client has time entries or doesn't exist.
+    """
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.execute("""
+        DELETE FROM clients
+        WHERE id = ? AND NOT EXISTS (SELECT 1 FROM time_entries WHERE client_id = ?)
+    """, (client_id, client_id))
+    if cursor.rowcount:
+        conn.commit()
+        return
+    # Nothing deleted - end the transaction the DELETE opened, then count
+    # entries only to explain why
+    conn.rollback()
     cursor.execute("SELECT COUNT(*) FROM time_entries WHERE client_id = ?", (client_id,))
     count = cursor.fetchone()[0]
     if count > 0:
-        conn.close()
         raise ValueError(f"Cannot delete: has {count} time entries. Archive instead.")
-    cursor.execute("DELETE FROM clients WHERE id = ?", (client_id,))
-    conn.commit()
-    conn.close()
+    raise ValueError(f"Client {client_id} not found")
+
+
+_SQL_INSERT_CLIENT = """
+    INSERT INTO clients (company_name, contact_name, address, city, state, zip, email,
+                        hourly_rate, track_activity, capture_screenshots,
+                        push_screenshots_remote, screenshot_keep_local,
+                        screenshot_remote_method, screenshot_unc_path, screenshot_unc_username,
+                        retainer_enabled, retainer_hours, retainer_rate,
+                        weekly_flat_rate_enabled, weekly_flat_rate)
+    VALUES (?, ?, '', '', '', '', '', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _client_insert_params(contact_name: str, company_name: str, hourly_rate: float,
+                          track_activity: bool = True, capture_screenshots: bool = False,
+                          screenshot_settings: Optional[Dict] = None,
+                          retainer_settings: Optional[Dict] = None,
+                          weekly_flat_rate_settings: Optional[Dict] = None) -> tuple:
+    """Build the _SQL_INSERT_CLIENT parameters from save_client's arguments."""
+    ss = screenshot_settings or {}
+    rs = retainer_settings or {}
+    ws = weekly_flat_rate_settings or {}
+    return (company_name, contact_name, hourly_rate,
+            1 if track_activity else 0, 1 if capture_screenshots else 0,
+            1 if ss.get('push_remote') else 0,
+            1 if ss.get('keep_local', True) else 0,
+            ss.get('remote_method'),
+            ss.get('unc_path'),
+            ss.get('unc_username'),
+            1 if rs.get('enabled') else 0,
+            rs.get('hours'),
+            rs.get('rate'),
+            1 if ws.get('enabled') else 0,
+            ws.get('rate'))
 
 
 def save_client(contact_name: str, company_name: str, hourly_rate: float,
                 track_activity: bool = True, capture_screenshots: bool = False,
                 screenshot_settings: Optional[Dict] = None,
                 retainer_settings: Optional[Dict] = None,
-                weekly_flat_rate_settings: Optional[Dict] = None) -> int:
+                weekly_flat_rate_settings: Optional[Dict] = None,
+                conn: Optional[sqlite3.Connection] = None) -> int:
     """Save new client, return ID.
 
     screenshot_settings dict can contain:
@@ -609,42 +1027,39 @@ def save_client(contact_name: str, company_name: str, hourly_rate: float,
     weekly_flat_rate_settings dict can contain:
         enabled, rate
     """
-    ss = screenshot_settings or {}
-    rs = retainer_settings or {}
-    ws = weekly_flat_rate_settings or {}
-    conn = get_connection()
+    owns_tx = conn is None
+    conn = conn or get_connection()
     cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO clients (company_name, contact_name, address, city, state, zip, email,
-                            hourly_rate, track_activity, capture_screenshots,
-                            push_screenshots_remote, screenshot_keep_local,
-                            screenshot_remote_method, screenshot_unc_path, screenshot_unc_username,
-                            retainer_enabled, retainer_hours, retainer_rate,
-                            weekly_flat_rate_enabled, weekly_flat_rate)
-        VALUES (?, ?, '', '', '', '', '', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (company_name, contact_name, hourly_rate,
-          1 if track_activity else 0, 1 if capture_screenshots else 0,
-          1 if ss.get('push_remote') else 0,
-          1 if ss.get('keep_local', True) else 0,
-          ss.get('remote_method'),
-          ss.get('unc_path'),
-          ss.get('unc_username'),
-          1 if rs.get('enabled') else 0,
-          rs.get('hours'),
-          rs.get('rate'),
-          1 if ws.get('enabled') else 0,
-          ws.get('rate')))
+    cursor.execute(_SQL_INSERT_CLIENT, _client_insert_params(
+        contact_name, company_name, hourly_rate, track_activity, capture_screenshots,
+        screenshot_settings, retainer_settings, weekly_flat_rate_settings))
     client_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    if owns_tx:
+        conn.commit()
     return client_id
 
 
+def save_clients_bulk(clients: List[Dict], conn: Optional[sqlite3.Connection] = None) -> int:
+    """Insert many clients with one prepared statement. Returns the count.
+
+    Each dict holds save_client's keyword arguments (contact_name,
+    company_name and hourly_rate are required).
+    """
+    owns_tx = conn is None
+    conn = conn or get_connection()
+    conn.executemany(_SQL_INSERT_CLIENT,
+                     [_client_insert_params(**client) for client in clients])
+    if owns_tx:
+        conn.commit()
+    return len(clients)
+
+
 def update_client(client_id: int, contact_name: str, company_name: str, hourly_rate: float,
                   track_activity: bool = True, capture_screenshots: bool = False,
                   screenshot_settings: Optional[Dict] = None,
                   retainer_settings: Optional[Dict] = None,
-                  weekly_flat_rate_settings: Optional[Dict] = None):
+                  weekly_flat_rate_settings: Optional[Dict] = None,
+                  conn: Optional[sqlite3.Connection] = None):
     """Update existing client.
 
     screenshot_settings dict can contain:
@@ -659,7 +1074,8 @@ def update_client(client_id: int, contact_name: str, company_name: str, hourly_r
     ss = screenshot_settings or {}
     rs = retainer_settings or {}
     ws = weekly_flat_rate_settings or {}
-    conn = get_connection()
+    owns_tx = conn is None
+    conn = conn or get_connection()
     cursor = conn.cursor()
     cursor.execute(
         """UPDATE clients SET contact_name = ?, company_name = ?, hourly_rate = ?,
@@ -683,15 +1099,17 @@ def update_client(client_id: int, contact_name: str, company_name: str, hourly_r
          ws.get('rate'),
          client_id)
     )
-    conn.commit()
-    conn.close()
+    if owns_tx:
+        conn.commit()
 
 
 def update_client_billing(client_id: int, bill_to: str, address: str, address2: str,
                           city: str, state: str, zip_code: str,
-                          email: str, payment_preference: str):
+                          email: str, payment_preference: str,
+                          conn: Optional[sqlite3.Connection] = None):
     """Update client billing/invoice info."""
-    conn = get_connection()
+    owns_tx = conn is None
+    conn = conn or get_connection()
     cursor = conn.cursor()
     cursor.execute("""
         UPDATE clients
@@ -699,29 +1117,53 @@ def update_client_billing(client_id: int, bill_to: str, address: str, address2:
             email = ?, payment_preference = ?
         WHERE id = ?
     """, (bill_to, address, address2, city, state, zip_code, email, payment_preference, client_id))
-    conn.commit()
-    conn.close()
+    if owns_tx:
+        conn.commit()
+
+
+def get_client_billing(client_id: int) -> Optional[Dict]:
+    """Get the name and billing address fields used on statements."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT company_name, contact_name, bill_to, address, address2, city, state, zip, email
+        FROM clients WHERE id = ?
+    """, (client_id,))
+    row = cursor.fetchone()
+    return dict(row) if row else None
 
 
 # === Invoices ===
 
+# SQL expression for the next invoice number. Use it inside the INSERT so the
+# number is taken atomically with the row rather than read ahead of it.
+NEXT_INVOICE_NUMBER_SQL = "printf('INV-%04d', (SELECT COALESCE(MAX(id), 0) + 1 FROM invoices))"
+
+
 def get_next_invoice_number() -> str:
     """Generate next invoice number."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT MAX(id) FROM invoices")
-    result = cursor.fetchone()[0]
-    conn.close()
-    next_num = (result or 0) + 1
-    return f"INV-{next_num:04d}"
+    cursor.execute("SELECT " + NEXT_INVOICE_NUMBER_SQL)
+    return cursor.fetchone()[0]
 
 
 def get_invoice(invoice_number: str) -> Optional[Dict]:
     """Get invoice by number with client info."""
+    invoice = _cached_read(('invoice', invoice_number), lambda: _fetch_invoice(invoice_number))
+    return dict(invoice) if invoice else None
+
+
+def _fetch_invoice(invoice_number: str) -> Optional[Dict]:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT i.*, c.company_name as client_name, c.contact_name,
+        SELECT i.id, i.invoice_number, i.client_id, i.date_issued, i.due_date,
+               i.description, i.billing_type, i.rate, i.quantity, i.total,
+               i.payment_terms, i.payment_method, i.status, i.date_paid, i.amount_paid,
+               i.retainer_hours_applied, i.overage_hours, i.is_retainer_invoice,
+               i.period_start, i.period_end,
+               c.company_name as client_name, c.contact_name,
                c.bill_to, c.address as client_address, c.address2 as client_address2,
                c.city as client_city, c.state as client_state, c.zip as client_zip,
                c.email as client_email
@@ -730,24 +1172,22 @@ def get_invoice(invoice_number: str) -> Optional[Dict]:
         WHERE i.invoice_number = ?
     """, (invoice_number,))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def get_invoices(limit: int = 20) -> List[Dict]:
-    """Get recent invoices with client info."""
+    """Get recent invoices with client info (listing columns only)."""
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT i.*, c.company_name as client_name
+        SELECT i.invoice_number, i.client_id, i.date_issued, i.due_date,
+               i.total, i.amount_paid, i.status, c.company_name as client_name
         FROM invoices i
         JOIN clients c ON i.client_id = c.id
         ORDER BY i.date_issued DESC
         LIMIT ?
     """, (limit,))
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    return [dict(row) for row in cursor]
 
 
 def get_invoice_hours(invoice_number: str) -> List[Dict]:
@@ -759,9 +1199,7 @@ def get_invoice_hours(invoice_number: str) -> List[Dict]:
         WHERE invoice_number = ?
         ORDER BY work_date
     """, (invoice_number,))
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    return [dict(row) for row in cursor]
 
 
 def get_weekly_breakdown(invoice_number: str) -> List[Dict]:
@@ -773,17 +1211,15 @@ def get_weekly_breakdown(invoice_number: str) -> List[Dict]:
     if not daily:
         return []
 
-    weeks = {}
+    hours_by_week = defaultdict(float)
     for entry in daily:
-        dt = datetime.fromisoformat(entry['work_date'])
-        ws, we = get_week_bounds(dt)
-        ws_str = ws.strftime('%Y-%m-%d')
-        we_str = we.strftime('%Y-%m-%d')
-        if ws_str not in weeks:
-            weeks[ws_str] = {'week_start': ws_str, 'week_end': we_str, 'hours': 0.0}
-        weeks[ws_str]['hours'] += entry['hours']
+        ws, _ = get_week_bounds(datetime.fromisoformat(entry['work_date']))
+        hours_by_week[ws] += entry['hours']
 
-    return sorted(weeks.values(), key=lambda w: w['week_start'])
+    return [{'week_start': ws.strftime('%Y-%m-%d'),
+             'week_end': (ws + timedelta(days=6)).strftime('%Y-%m-%d'),
+             'hours': hours}
+            for ws, hours in sorted(hours_by_week.items())]
 
 
 def record_payment(invoice_number: str, amount: float, date_paid: Optional[str] = None):
@@ -792,34 +1228,22 @@ def record_payment(invoice_number: str, amount: float, date_paid: Optional[str]
         date_paid = datetime.now().strftime('%Y-%m-%d')
 
     conn = get_connection()
-    cursor = conn.cursor()
-
-    # Get current invoice
-    cursor.execute("SELECT total, COALESCE(amount_paid, 0) as paid FROM invoices WHERE invoice_number = ?",
-                   (invoice_number,))
-    row = cursor.fetchone()
-    if not row:
-        conn.close()
-        return
-
-    total = row['total']
-    current_paid = row['paid']
-    new_paid = current_paid + amount
-
-    # Determine status
-    if new_paid >= total - 0.01:
-        status = 'paid'
-    elif new_paid > 0:
-        status = 'partial'
-    else:
-        status = 'unpaid'
-
-    cursor.execute("""
-        UPDATE invoices SET amount_paid = ?, status = ?, date_paid = ?
-        WHERE invoice_number = ?
-    """, (new_paid, status, date_paid if status == 'paid' else None, invoice_number))
+    # One atomic UPDATE; the CASEs see the row's amount_paid from before the payment.
+    # Paid in full (within a cent) sets date_paid, anything less clears it.
+    conn.execute("""
+        UPDATE invoices SET
+            amount_paid = COALESCE(amount_paid, 0) + :amount,
+            status = CASE
+                WHEN COALESCE(amount_paid, 0) + :amount >= total - 0.01 THEN 'paid'
+                WHEN COALESCE(amount_paid, 0) + :amount > 0 THEN 'partial'
+                ELSE 'unpaid'
+            END,
+            date_paid = CASE
+                WHEN COALESCE(amount_paid, 0) + :amount >= total - 0.01 THEN :date_paid
+            END
+        WHERE invoice_number = :invoice_number
+    """, {'amount': amount, 'date_paid': date_paid, 'invoice_number': invoice_number})
     conn.commit()
-    conn.close()
 
 
 def update_invoice_payment_method(invoice_number: str, payment_method: str) -> bool:
@@ -831,7 +1255,6 @@ def update_invoice_payment_method(invoice_number: str, payment_method: str) -> b
         (payment_method, invoice_number))
     updated = cursor.rowcount > 0
     conn.commit()
-    conn.close()
     return updated
 
 
@@ -844,7 +1267,6 @@ def update_invoice_terms(invoice_number: str, payment_terms: str, due_date: str)
         (payment_terms, due_date, invoice_number))
     updated = cursor.rowcount > 0
     conn.commit()
-    conn.close()
     return updated
 
 
@@ -854,18 +1276,12 @@ def mark_invoice_paid(invoice_number: str, date_paid: Optional[str] = None):
         date_paid = datetime.now().strftime('%Y-%m-%d')
 
     conn = get_connection()
-    cursor = conn.cursor()
-
-    # Get total and set amount_paid to match
-    cursor.execute("SELECT total FROM invoices WHERE invoice_number = ?", (invoice_number,))
-    row = cursor.fetchone()
-    if row:
-        cursor.execute("""
-            UPDATE invoices SET status = 'paid', date_paid = ?, amount_paid = ?
-            WHERE invoice_number = ?
-        """, (date_paid, row['total'], invoice_number))
-        conn.commit()
-    conn.close()
+    # Set amount_paid to match the total in the same statement
+    conn.execute("""
+        UPDATE invoices SET status = 'paid', date_paid = ?, amount_paid = total
+        WHERE invoice_number = ?
+    """, (date_paid, invoice_number))
+    conn.commit()
 
     # Clean up screenshots for this invoice's time entries
     cleanup_paid_invoice_screenshots(invoice_number)
@@ -873,10 +1289,15 @@ def mark_invoice_paid(invoice_number: str, date_paid: Optional[str] = None):
 
 def get_invoice_pdf_path(invoice_number: str) -> Optional[Path]:
     """Get the path to an invoice PDF if it exists."""
-    invoice = get_invoice(invoice_number)
-    if not invoice:
+    conn = get_connection()
+    row = conn.execute("""
+        SELECT c.company_name FROM invoices i
+        JOIN clients c ON i.client_id = c.id
+        WHERE i.invoice_number = ?
+    """, (invoice_number,)).fetchone()
+    if not row:
         return None
-    client_folder = get_invoices_dir() / invoice['client_name'].replace(' ', '_')
+    client_folder = get_invoices_dir() / row['company_name'].replace(' ', '_')
     pdf_path = client_folder / f"{invoice_number}.pdf"
     if pdf_path.exists():
         return pdf_path
@@ -911,7 +1332,6 @@ def delete_invoice(invoice_number: str, restore_hours: bool = True, delete_pdf:
         invoice = cursor.fetchone()
 
         if not invoice:
-            conn.close()
             return {'success': False, 'message': f"Invoice {invoice_number} not found."}
 
         invoice = dict(invoice)
@@ -920,7 +1340,6 @@ def delete_invoice(invoice_number: str, restore_hours: bool = True, delete_pdf:
 
         # Block deletion of fully paid invoices
         if invoice['status'] == 'paid' or amount_paid >= total:
-            conn.close()
             raise ValueError(
                 f"Cannot delete fully paid invoice {invoice_number}. "
                 f"Paid invoices are protected financial records."
@@ -972,12 +1391,26 @@ def delete_invoice(invoice_number: str, restore_hours: bool = True, delete_pdf:
     except Exception as e:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 # === Time Entries ===
 
+# Write timestamps are stamped by SQLite (local time, ISO 8601 with ms)
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+_SQL_INSERT_TIME_ENTRY = """
+    INSERT INTO time_entries
+    (client_id, start_time, end_time, duration_seconds, description, entry_type, created_at,
+     key_presses, mouse_clicks, mouse_moves)
+    VALUES (?, ?, ?, ?, ?, ?, """ + _SQL_NOW + """, ?, ?, ?)
+"""
+_SQL_SELECT_TIME_ENTRIES = """
+    SELECT id, client_id, start_time, end_time, duration_seconds, description,
+           entry_type, invoiced, invoice_number, key_presses, mouse_clicks, mouse_moves
+    FROM time_entries
+"""
+
+
 def save_time_entry(
     client_id: int,
     start_time: datetime,
@@ -992,26 +1425,19 @@ def save_time_entry(
     """Save a time entry, return ID."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO time_entries
-        (client_id, start_time, end_time, duration_seconds, description, entry_type, created_at,
-         key_presses, mouse_clicks, mouse_moves)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+    cursor.execute(_SQL_INSERT_TIME_ENTRY, (
         client_id,
         start_time.isoformat(),
         end_time.isoformat() if end_time else None,
         duration_seconds,
         description,
         entry_type,
-        datetime.now().isoformat(),
         key_presses,
         mouse_clicks,
         mouse_moves
     ))
     entry_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return entry_id
 
 
@@ -1044,70 +1470,70 @@ def update_time_entry(
             values
         )
         conn.commit()
-    conn.close()
 
 
 def mark_entries_invoiced(entry_ids: List[int], invoice_number: str):
     """Mark time entries as invoiced."""
     conn = get_connection()
     cursor = conn.cursor()
-    placeholders = ','.join('?' * len(entry_ids))
-    cursor.execute(f"""
+    # One cached statement per row instead of an IN list sized to the batch
+    # (which also can't exceed SQLite's bound-parameter limit)
+    cursor.executemany("""
         UPDATE time_entries
         SET invoiced = 1, invoice_number = ?
-        WHERE id IN ({placeholders})
-    """, [invoice_number] + entry_ids)
+        WHERE id = ?
+    """, [(invoice_number, entry_id) for entry_id in entry_ids])
     conn.commit()
-    conn.close()
 
 
 def delete_time_entry(entry_id: int) -> bool:
-    """Delete a time entry. Returns True if deleted, False if invoiced."""
+    """Delete a time entry. Returns True if deleted, False if not found.
+
+    Raises ValueError if the entry has been invoiced.
+    """
     conn = get_connection()
     cursor = conn.cursor()
-    # Check if invoiced
-    cursor.execute("SELECT invoiced FROM time_entries WHERE id = ?", (entry_id,))
-    row = cursor.fetchone()
-    if not row:
-        conn.close()
-        return False
-    if row['invoiced']:
-        conn.close()
+    cursor.execute("DELETE FROM time_entries WHERE id = ? AND COALESCE(invoiced, 0) = 0",
+                   (entry_id,))
+    if cursor.rowcount == 1:
+        conn.commit()
+        return True
+    # Nothing deleted - end the transaction the DELETE opened, then find out why
+    conn.rollback()
+    cursor.execute("SELECT 1 FROM time_entries WHERE id = ?", (entry_id,))
+    if cursor.fetchone():
         raise ValueError("Cannot delete invoiced time entry")
-    cursor.execute("DELETE FROM time_entries WHERE id = ?", (entry_id,))
-    conn.commit()
-    conn.close()
-    return True
+    return False
 
 
 def get_time_entry(entry_id: int) -> Optional[Dict]:
     """Get a single time entry by ID."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM time_entries WHERE id = ?", (entry_id,))
+    cursor.execute(_SQL_SELECT_TIME_ENTRIES + " WHERE id = ?", (entry_id,))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def get_first_uninvoiced_date(client_id: Optional[int] = None) -> Optional[str]:
     """Get the earliest date with uninvoiced time entries."""
+    # ISO timestamps sort chronologically, so take the date of the MIN
+    # rather than parsing every row; MIN can then seek the uninvoiced index
     conn = get_connection()
     cursor = conn.cursor()
     if client_id:
         cursor.execute("""
-            SELECT MIN(date(start_time)) as first_date
+            SELECT date(MIN(start_time)) as first_date
             FROM time_entries
             WHERE client_id = ? AND invoiced = 0 AND duration_seconds IS NOT NULL
         """, (client_id,))
     else:
         cursor.execute("""
-            SELECT MIN(date(start_time)) as first_date
+            SELECT date(MIN(start_time)) as first_date
             FROM time_entries
             WHERE invoiced = 0 AND duration_seconds IS NOT NULL
         """)
     row = cursor.fetchone()
-    conn.close()
     return row['first_date'] if row else None
 
 
@@ -1122,113 +1548,65 @@ def get_time_entries(
     conn = get_connection()
     cursor = conn.cursor()
 
-    query = "SELECT * FROM time_entries WHERE 1=1"
+    filters = (
+        (client_id, client_id),
+        (start_date, start_date and start_date.isoformat()),
+        (end_date, end_date and end_date.isoformat()),
+        (invoiced, 1 if invoiced else 0),
+        # Bound rather than formatted so the statement cache sees one SQL text
+        (limit, limit is not None and int(limit)),
+    )
+    mask = 0
     params = []
+    for bit, (arg, param) in enumerate(filters):
+        if arg is not None:
+            mask |= 1 << bit
+            params.append(param)
 
-    if client_id is not None:
-        query += " AND client_id = ?"
-        params.append(client_id)
-    if start_date is not None:
-        query += " AND start_time >= ?"
-        params.append(start_date.isoformat())
-    if end_date is not None:
-        query += " AND start_time < ?"
-        params.append(end_date.isoformat())
-    if invoiced is not None:
-        query += " AND invoiced = ?"
-        params.append(1 if invoiced else 0)
+    cursor.execute(_time_entries_query(mask), params)
+    return [dict(row) for row in cursor]
 
-    query += " ORDER BY start_time DESC"
 
-    if limit is not None:
-        query += f" LIMIT {int(limit)}"
+@lru_cache(maxsize=None)
+def _time_entries_query(mask: int) -> str:
+    """Build get_time_entries' SQL once per combination of filters.
 
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    Bits follow get_time_entries' filter order: client, start, end,
+    invoiced, limit.
+    """
+    clauses = ["client_id = ?", "start_time >= ?", "start_time < ?", "invoiced = ?"]
+    query = _SQL_SELECT_TIME_ENTRIES + " WHERE 1=1"
+    for bit, clause in enumerate(clauses):
+        if mask & (1 << bit):
+            query += " AND " + clause
+    query += " ORDER BY start_time DESC"
+    if mask & (1 << len(clauses)):
+        query += " LIMIT ?"
+    return query
 
 
 def get_global_time_summary() -> Dict[str, float]:
     """Get global time summary across all clients."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    now = datetime.now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    days_since_monday = now.weekday()
-    week_start = (today_start - timedelta(days=days_since_monday))
-
-    # Today (all clients)
-    cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
-        FROM time_entries
-        WHERE start_time >= ? AND duration_seconds IS NOT NULL
-    """, (today_start.isoformat(),))
-    today_seconds = cursor.fetchone()['total']
+    return _cached_time_summary(None)
 
-    # This week (all clients)
-    cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
-        FROM time_entries
-        WHERE start_time >= ? AND duration_seconds IS NOT NULL
-    """, (week_start.isoformat(),))
-    week_seconds = cursor.fetchone()['total']
-
-    # Uninvoiced (all clients)
-    cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
-        FROM time_entries
-        WHERE invoiced = 0 AND duration_seconds IS NOT NULL
-    """)
-    uninvoiced_seconds = cursor.fetchone()['total']
 
-    # Invoiced (not yet paid) - from invoice_hours for unpaid invoices
-    cursor.execute("""
-        SELECT COALESCE(SUM(ih.hours), 0) as total
-        FROM invoice_hours ih
-        JOIN invoices i ON ih.invoice_number = i.invoice_number
-        WHERE i.status != 'paid'
-    """)
-    invoiced_hours = cursor.fetchone()['total']
+def get_time_summary(client_id: int) -> Dict[str, float]:
+    """Get time summary for a client: today, this week, uninvoiced, invoiced."""
+    return _cached_time_summary(client_id)
 
-    # Paid - from invoice_hours for paid invoices
-    cursor.execute("""
-        SELECT COALESCE(SUM(ih.hours), 0) as total
-        FROM invoice_hours ih
-        JOIN invoices i ON ih.invoice_number = i.invoice_number
-        WHERE i.status = 'paid'
-    """)
-    paid_hours = cursor.fetchone()['total']
 
-    # Invoice amounts (includes flat rate invoices)
-    cursor.execute("""
-        SELECT COALESCE(SUM(total), 0) as total
-        FROM invoices WHERE status != 'paid'
-    """)
-    invoiced_amount = cursor.fetchone()['total']
+def _cached_time_summary(client_id: Optional[int]) -> Dict[str, float]:
+    # Keyed on the date too: "today" and "this week" move at midnight
+    key = ('time_summary', client_id, datetime.now().date())
+    return dict(_cached_read(key, lambda: _time_summary(client_id)))
 
-    cursor.execute("""
-        SELECT COALESCE(SUM(total), 0) as total
-        FROM invoices WHERE status = 'paid'
-    """)
-    paid_amount = cursor.fetchone()['total']
 
-    conn.close()
+def _time_summary(client_id: Optional[int]) -> Dict[str, float]:
+    """Summarize time and invoices for one client, or all when client_id is None.
 
-    return {
-        'today_hours': today_seconds / 3600,
-        'week_hours': week_seconds / 3600,
-        'uninvoiced_hours': uninvoiced_seconds / 3600,
-        'invoiced_hours': invoiced_hours,
-        'paid_hours': paid_hours,
-        'invoiced_amount': invoiced_amount,
-        'paid_amount': paid_amount,
-    }
-
-
-def get_time_summary(client_id: int) -> Dict[str, float]:
-    """Get time summary for a client: today, this week, uninvoiced, invoiced."""
+    One pass over time_entries using conditional sums; invoice figures come
+    from the trigger-maintained client_stats rollup.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -1239,71 +1617,40 @@ def get_time_summary(client_id: int) -> Dict[str, float]:
     days_since_monday = now.weekday()
     week_start = (today_start - timedelta(days=days_since_monday))
 
-    # Today
-    cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
-        FROM time_entries
-        WHERE client_id = ? AND start_time >= ? AND duration_seconds IS NOT NULL
-    """, (client_id, today_start.isoformat()))
-    today_seconds = cursor.fetchone()['total']
-
-    # This week
-    cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
-        FROM time_entries
-        WHERE client_id = ? AND start_time >= ? AND duration_seconds IS NOT NULL
-    """, (client_id, week_start.isoformat()))
-    week_seconds = cursor.fetchone()['total']
+    params = {
+        'client_id': client_id,
+        'today': today_start.isoformat(),
+        'week': week_start.isoformat(),
+    }
+    client_filter = "client_id = :client_id" if client_id is not None else "1"
 
-    # Uninvoiced
+    # Seconds are converted to hours in SQL, once per figure
     cursor.execute("""
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
+        SELECT COALESCE(SUM(CASE WHEN start_time >= :today THEN duration_seconds END), 0) / 3600.0 as today,
+               COALESCE(SUM(CASE WHEN start_time >= :week THEN duration_seconds END), 0) / 3600.0 as week,
+               COALESCE(SUM(CASE WHEN invoiced = 0 THEN duration_seconds END), 0) / 3600.0 as uninvoiced
         FROM time_entries
-        WHERE client_id = ? AND invoiced = 0 AND duration_seconds IS NOT NULL
-    """, (client_id,))
-    uninvoiced_seconds = cursor.fetchone()['total']
-
-    # Invoiced (not yet paid) - from invoice_hours for this client's unpaid invoices
-    cursor.execute("""
-        SELECT COALESCE(SUM(ih.hours), 0) as total
-        FROM invoice_hours ih
-        JOIN invoices i ON ih.invoice_number = i.invoice_number
-        WHERE i.client_id = ? AND i.status != 'paid'
-    """, (client_id,))
-    invoiced_hours = cursor.fetchone()['total']
-
-    # Paid - from invoice_hours for this client's paid invoices
-    cursor.execute("""
-        SELECT COALESCE(SUM(ih.hours), 0) as total
-        FROM invoice_hours ih
-        JOIN invoices i ON ih.invoice_number = i.invoice_number
-        WHERE i.client_id = ? AND i.status = 'paid'
-    """, (client_id,))
-    paid_hours = cursor.fetchone()['total']
+        WHERE duration_seconds IS NOT NULL AND """ + client_filter, params)
+    entries = cursor.fetchone()
 
-    # Invoice amounts (includes flat rate invoices)
+    # Hours come from invoice_hours; amounts include flat rate invoices
     cursor.execute("""
-        SELECT COALESCE(SUM(total), 0) as total
-        FROM invoices WHERE client_id = ? AND status != 'paid'
-    """, (client_id,))
-    invoiced_amount = cursor.fetchone()['total']
-
-    cursor.execute("""
-        SELECT COALESCE(SUM(total), 0) as total
-        FROM invoices WHERE client_id = ? AND status = 'paid'
-    """, (client_id,))
-    paid_amount = cursor.fetchone()['total']
-
-    conn.close()
+        SELECT COALESCE(SUM(invoiced_hours), 0) as invoiced_hours,
+               COALESCE(SUM(paid_hours), 0) as paid_hours,
+               COALESCE(SUM(invoiced_amount), 0) as invoiced_amount,
+               COALESCE(SUM(paid_amount), 0) as paid_amount
+        FROM client_stats
+        WHERE """ + client_filter, params)
+    invoices = cursor.fetchone()
 
     return {
-        'today_hours': today_seconds / 3600,
-        'week_hours': week_seconds / 3600,
-        'uninvoiced_hours': uninvoiced_seconds / 3600,
-        'invoiced_hours': invoiced_hours,
-        'paid_hours': paid_hours,
-        'invoiced_amount': invoiced_amount,
-        'paid_amount': paid_amount,
+        'today_hours': entries['today'],
+        'week_hours': entries['week'],
+        'uninvoiced_hours': entries['uninvoiced'],
+        'invoiced_hours': invoices['invoiced_hours'],
+        'paid_hours': invoices['paid_hours'],
+        'invoiced_amount': invoices['invoiced_amount'],
+        'paid_amount': invoices['paid_amount'],
     }
 
 
@@ -1316,37 +1663,39 @@ def save_active_timer(client_id: int, start_time: datetime, accumulated_seconds:
     cursor.execute("""
         INSERT OR REPLACE INTO active_timer
         (id, client_id, start_time, last_save_time, accumulated_seconds)
-        VALUES (1, ?, ?, ?, ?)
+        VALUES (1, ?, ?, """ + _SQL_NOW + """, ?)
     """, (
         client_id,
         start_time.isoformat(),
-        datetime.now().isoformat(),
         accumulated_seconds
     ))
     conn.commit()
-    conn.close()
+
+
+_SQL_UPDATE_ACTIVE_TIMER = """
+    UPDATE active_timer
+    SET last_save_time = """ + _SQL_NOW + """, accumulated_seconds = ?
+    WHERE id = 1
+"""
 
 
 def update_active_timer(accumulated_seconds: int):
     """Update active timer with current accumulated time."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE active_timer
-        SET last_save_time = ?, accumulated_seconds = ?
-        WHERE id = 1
-    """, (datetime.now().isoformat(), accumulated_seconds))
+    cursor.execute(_SQL_UPDATE_ACTIVE_TIMER, (accumulated_seconds,))
     conn.commit()
-    conn.close()
 
 
 def get_active_timer() -> Optional[Dict]:
     """Get active timer state if exists."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM active_timer WHERE id = 1")
+    cursor.execute("""
+        SELECT client_id, start_time, last_save_time, accumulated_seconds
+        FROM active_timer WHERE id = 1
+    """)
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
@@ -1356,7 +1705,6 @@ def clear_active_timer():
     cursor = conn.cursor()
     cursor.execute("DELETE FROM active_timer WHERE id = 1")
     conn.commit()
-    conn.close()
 
 
 # === Screenshots ===
@@ -1365,24 +1713,23 @@ def get_screenshots_dir() -> Path:
     """Get the screenshots directory (creates if needed)."""
     custom = get_setting('screenshot_local_dir', '')
     if custom:
-        screenshots_dir = Path(custom)
-    else:
-        screenshots_dir = get_data_dir() / "screenshots"
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-    return screenshots_dir
+        return _ensure_dir(Path(custom))
+    return _ensure_dir(get_data_dir() / "screenshots")
+
+
+_SQL_INSERT_SCREENSHOT = """
+    INSERT INTO screenshots (client_id, captured_at, file_path)
+    VALUES (?, """ + _SQL_NOW + """, ?)
+"""
 
 
 def save_screenshot(client_id: int, file_path: str) -> int:
     """Save a screenshot record, return ID."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO screenshots (client_id, captured_at, file_path)
-        VALUES (?, ?, ?)
-    """, (client_id, datetime.now().isoformat(), file_path))
+    cursor.execute(_SQL_INSERT_SCREENSHOT, (client_id, file_path))
     screenshot_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return screenshot_id
 
 
@@ -1392,13 +1739,11 @@ def link_screenshots_to_entry(screenshot_ids: List[int], entry_id: int):
         return
     conn = get_connection()
     cursor = conn.cursor()
-    placeholders = ','.join('?' * len(screenshot_ids))
-    cursor.execute(f"""
+    cursor.executemany("""
         UPDATE screenshots SET time_entry_id = ?
-        WHERE id IN ({placeholders})
-    """, [entry_id] + screenshot_ids)
+        WHERE id = ?
+    """, [(entry_id, screenshot_id) for screenshot_id in screenshot_ids])
     conn.commit()
-    conn.close()
 
 
 def delete_screenshot(screenshot_id: int) -> Optional[str]:
@@ -1411,9 +1756,7 @@ def delete_screenshot(screenshot_id: int) -> Optional[str]:
         file_path = row['file_path']
         cursor.execute("DELETE FROM screenshots WHERE id = ?", (screenshot_id,))
         conn.commit()
-        conn.close()
         return file_path
-    conn.close()
     return None
 
 
@@ -1422,25 +1765,20 @@ def cleanup_paid_invoice_screenshots(invoice_number: str):
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Find all screenshots linked to time entries with this invoice_number
+    # Drop every screenshot linked to this invoice's time entries in one statement
     cursor.execute("""
-        SELECT s.id, s.file_path
-        FROM screenshots s
-        JOIN time_entries te ON s.time_entry_id = te.id
-        WHERE te.invoice_number = ?
+        DELETE FROM screenshots
+        WHERE time_entry_id IN (SELECT id FROM time_entries WHERE invoice_number = ?)
+        RETURNING file_path
     """, (invoice_number,))
+    file_paths = [row['file_path'] for row in cursor.fetchall()]
+    conn.commit()
 
-    for row in cursor.fetchall():
-        # Delete file
+    for file_path in file_paths:
         try:
-            Path(row['file_path']).unlink(missing_ok=True)
+            Path(file_path).unlink(missing_ok=True)
         except Exception:
             pass
-        # Delete record
-        cursor.execute("DELETE FROM screenshots WHERE id = ?", (row['id'],))
-
-    conn.commit()
-    conn.close()
 
 
 # === Outstanding Invoices (for statements) ===
@@ -1457,25 +1795,28 @@ def get_outstanding_invoices(client_id: int) -> List[Dict[str, Any]]:
             description,
             total,
             COALESCE(amount_paid, 0) as amount_paid,
-            status
+            status,
+            total - COALESCE(amount_paid, 0) as outstanding,
+            -- Whole days past due as of today (negative if not yet due)
+            CAST(julianday('now', 'localtime', 'start of day') - julianday(date(due_date))
+                 AS INTEGER) as days_overdue
         FROM invoices
         WHERE client_id = ? AND status != 'paid'
         ORDER BY date_issued
     """, (client_id,))
-    invoices = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-
-    # Calculate outstanding balance for each
-    for inv in invoices:
-        inv['outstanding'] = inv['total'] - inv['amount_paid']
-
-    return invoices
+    return [dict(row) for row in cursor]
 
 
 def get_outstanding_balance(client_id: int) -> float:
     """Get total outstanding balance for a client across all unpaid invoices."""
-    invoices = get_outstanding_invoices(client_id)
-    return sum(inv['outstanding'] for inv in invoices)
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COALESCE(SUM(total - COALESCE(amount_paid, 0)), 0) as balance
+        FROM invoices
+        WHERE client_id = ? AND status != 'paid'
+    """, (client_id,))
+    return cursor.fetchone()['balance']
 
 
 # === Tax Year Summary ===
@@ -1504,7 +1845,7 @@ def get_tax_year_summary(year: int) -> Dict[str, Any]:
         GROUP BY c.id
         ORDER BY total_paid DESC
     """, (year_start, year_end))
-    by_client = [dict(row) for row in cursor.fetchall()]
+    by_client = [dict(row) for row in cursor]
 
     # Get individual invoice details (any with payments)
     cursor.execute("""
@@ -1524,32 +1865,24 @@ def get_tax_year_summary(year: int) -> Dict[str, Any]:
           AND i.date_paid >= ? AND i.date_paid <= ?
         ORDER BY i.date_paid
     """, (year_start, year_end))
-    invoices = [dict(row) for row in cursor.fetchall()]
+    invoices = [dict(row) for row in cursor]
 
     # Total
     total_income = sum(c['total_paid'] for c in by_client)
 
-    # Quarterly totals (for estimated tax purposes)
-    quarters = {}
-    for q in range(1, 5):
-        if q == 1:
-            q_start, q_end = f"{year}-01-01", f"{year}-03-31"
-        elif q == 2:
-            q_start, q_end = f"{year}-04-01", f"{year}-06-30"
-        elif q == 3:
-            q_start, q_end = f"{year}-07-01", f"{year}-09-30"
-        else:
-            q_start, q_end = f"{year}-10-01", f"{year}-12-31"
-
-        cursor.execute("""
-            SELECT COALESCE(SUM(amount_paid), 0) as total
-            FROM invoices
-            WHERE amount_paid > 0
-              AND date_paid >= ? AND date_paid <= ?
-        """, (q_start, q_end))
-        quarters[f"q{q}"] = cursor.fetchone()['total']
+    # Quarterly totals (for estimated tax purposes), quarter taken from the month
+    quarters = {f"q{q}": 0 for q in range(1, 5)}
+    cursor.execute("""
+        SELECT (CAST(substr(date_paid, 6, 2) AS INTEGER) + 2) / 3 as quarter,
+               SUM(amount_paid) as total
+        FROM invoices
+        WHERE amount_paid > 0
+          AND date_paid >= ? AND date_paid <= ?
+        GROUP BY quarter
+    """, (year_start, year_end))
+    for row in cursor:
+        quarters[f"q{row['quarter']}"] = row['total']
 
-    conn.close()
 
     return {
         'year': year,
@@ -1588,11 +1921,10 @@ def count_weeks_in_entries(entries: list) -> tuple:
     first Monday and period_end is the last Sunday (YYYY-MM-DD strings).
     Returns (0, None, None) for empty entries.
     """
-    week_starts = set()
-    for entry in entries:
-        dt = datetime.fromisoformat(entry['start_time'])
-        ws, _ = get_week_bounds(dt)
-        week_starts.add(ws.strftime('%Y-%m-%d'))
+    # start_time is stored ISO, so its first 10 chars are the date; only
+    # parse each distinct day rather than every entry
+    work_dates = {entry['start_time'][:10] for entry in entries}
+    week_starts = {get_week_start_str(datetime.fromisoformat(d)) for d in work_dates}
     if not week_starts:
         return (0, None, None)
     sorted_weeks = sorted(week_starts)
@@ -1611,7 +1943,6 @@ def is_week_exempted(client_id: int, week_start: str) -> bool:
         WHERE client_id = ? AND week_start = ?
     """, (client_id, week_start))
     result = cursor.fetchone() is not None
-    conn.close()
     return result
 
 
@@ -1625,7 +1956,6 @@ def get_retainer_exemption(client_id: int, week_start: str) -> Optional[Dict]:
         WHERE client_id = ? AND week_start = ?
     """, (client_id, week_start))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
@@ -1635,11 +1965,10 @@ def add_retainer_exemption(client_id: int, week_start: str, reason: str = '') ->
     cursor = conn.cursor()
     cursor.execute("""
         INSERT OR REPLACE INTO retainer_exemptions (client_id, week_start, reason, created_at)
-        VALUES (?, ?, ?, ?)
-    """, (client_id, week_start, reason, datetime.now().isoformat()))
+        VALUES (?, ?, ?, """ + _SQL_NOW + """)
+    """, (client_id, week_start, reason))
     exemption_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return exemption_id
 
 
@@ -1652,7 +1981,6 @@ def remove_retainer_exemption(client_id: int, week_start: str):
         WHERE client_id = ? AND week_start = ?
     """, (client_id, week_start))
     conn.commit()
-    conn.close()
 
 
 def get_retainer_week_summary(client_id: int, week_start: str) -> Dict[str, Any]:
@@ -1751,11 +2079,9 @@ def check_time_entry_overlaps(
         params.append(exclude_entry_id)
 
     cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
 
     overlaps = []
-    for row in rows:
+    for row in cursor:
         entry = dict(row)
         # Calculate overlap amount
         existing_start = datetime.fromisoformat(entry['start_time'])
@@ -1794,7 +2120,7 @@ def get_daily_hours(
     day_end = day_start + timedelta(days=1)
 
     query = """
-        SELECT COALESCE(SUM(duration_seconds), 0) as total
+        SELECT COALESCE(SUM(duration_seconds), 0) / 3600.0 as total
         FROM time_entries
         WHERE client_id = ?
           AND start_time >= ?
@@ -1809,24 +2135,22 @@ def get_daily_hours(
         params.append(exclude_entry_id)
 
     cursor.execute(query, params)
-    total_seconds = cursor.fetchone()['total']
-    conn.close()
-
-    return total_seconds / 3600
+    return cursor.fetchone()['total']
 
 
 # === Helpers ===
 
+@lru_cache(maxsize=4096)
 def format_currency(amount: float) -> str:
-    """Format amount as currency."""
+    """Format amount as currency. Memoized; rates and totals repeat across a PDF."""
     return f"${amount:,.2f}"
 
 
-def format_date_display(iso_date: str) -> str:
-    """Format ISO date for display (Month DD, YYYY)."""
-    dt = datetime.fromisoformat(iso_date)
-    return dt.strftime("%B %d, %Y")
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
 
 
-# Initialize on import
-init_db()
+def format_date_display(iso_date: str) -> str:
+    """Format ISO date for display (Month DD, YYYY)."""
+    # Slice the fixed-width YYYY-MM-DD prefix instead of building a datetime
+    return f"{_MONTH_NAMES[int(iso_date[5:7]) - 1]} {iso_date[8:10]}, {iso_date[:4]}"
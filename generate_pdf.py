@@ -1,8 +1,10 @@
 """Generate professional PDF invoices using reportlab."""
 
+import io
 import sys
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 try:
     from reportlab.lib import colors
@@ -12,58 +14,49 @@ try:
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
     from reportlab.lib.enums import TA_RIGHT, TA_CENTER, TA_LEFT
     REPORTLAB_AVAILABLE = True
+
+    # Palette shared by the stylesheet and table styles
+    _C_DARK = colors.HexColor('#1a1a1a')   # company name, total due
+    _C_MID = colors.HexColor('#333333')    # titles and section headers
+    _C_GREY = colors.HexColor('#666666')   # secondary text and labels
+    _C_LINE = colors.HexColor('#dddddd')   # table rules
+    _C_BG = colors.HexColor('#f5f5f5')     # table header background
+
+    # Page margins and table column widths, in points
+    _PAGE_MARGINS = dict(rightMargin=0.75*inch, leftMargin=0.75*inch,
+                         topMargin=0.5*inch, bottomMargin=0.5*inch)
+    _COL_HEADER = (4*inch, 3*inch)
+    _COL_DETAILS = (1.2*inch, 1.8*inch)
+    _COL_ROW = (3.5*inch, 3.5*inch)
+    _COL_BREAKDOWN = (1.5*inch, 2*inch)
+    _COL_WIDTHS_ITEMS_DAILY = (2.5*inch, 1.5*inch, 3*inch)
+    _COL_WIDTHS_ITEMS_FLAT = (3.5*inch, 1.25*inch, 1*inch, 1.25*inch)
+    _COL_WIDTHS_ITEMS_WEEKLY = (1*inch, 2.75*inch, 1.25*inch, 1.5*inch)
+    _COL_WIDTHS_STATEMENT = (0.9*inch, 0.8*inch, 0.8*inch, 1.2*inch, 0.85*inch, 0.7*inch, 0.85*inch)
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
 import db
 
 
-def generate_invoice_pdf(invoice_number: str) -> Path:
-    """Generate PDF for an invoice, return path to file."""
-    if not REPORTLAB_AVAILABLE:
-        raise ImportError("reportlab is required for PDF generation. Install with: pip install reportlab")
-
-    invoice = db.get_invoice(invoice_number)
-    if not invoice:
-        raise ValueError(f"Invoice {invoice_number} not found")
-
-    business = db.get_business_info()
-    if not business:
-        raise ValueError("Business info not configured. Go to Edit > Business Setup.")
-
-    banking = db.get_banking()
-    if not banking:
-        raise ValueError("Banking info not configured. Go to Edit > Business Setup.")
-
-    # Organize by client name
-    client_folder = db.get_pdfs_dir() / invoice['client_name'].replace(' ', '_')
-    client_folder.mkdir(exist_ok=True)
-    output_path = client_folder / f"{invoice_number}.pdf"
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
-
+@lru_cache(maxsize=1)
+def _get_styles():
+    """Build the invoice and statement stylesheet once per process."""
     styles = getSampleStyleSheet()
 
-    # Custom styles
     styles.add(ParagraphStyle(
         'CompanyName',
         parent=styles['Heading1'],
         fontSize=24,
         spaceAfter=6,
-        textColor=colors.HexColor('#1a1a1a')
+        textColor=_C_DARK
     ))
 
     styles.add(ParagraphStyle(
         'CompanyInfo',
         parent=styles['Normal'],
         fontSize=9,
-        textColor=colors.HexColor('#666666'),
+        textColor=_C_GREY,
         leading=12
     ))
 
@@ -72,7 +65,15 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
         parent=styles['Heading1'],
         fontSize=28,
         alignment=TA_RIGHT,
-        textColor=colors.HexColor('#333333')
+        textColor=_C_MID
+    ))
+
+    styles.add(ParagraphStyle(
+        'StatementTitle',
+        parent=styles['Heading1'],
+        fontSize=28,
+        alignment=TA_RIGHT,
+        textColor=_C_MID
     ))
 
     styles.add(ParagraphStyle(
@@ -81,7 +82,7 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
         fontSize=11,
         spaceBefore=12,
         spaceAfter=6,
-        textColor=colors.HexColor('#333333')
+        textColor=_C_MID
     ))
 
     styles.add(ParagraphStyle(
@@ -91,12 +92,21 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
         leading=14
     ))
 
+    styles.add(ParagraphStyle(
+        'TotalDue',
+        parent=styles['Normal'],
+        fontSize=14,
+        alignment=TA_RIGHT,
+        textColor=_C_DARK,
+        fontName='Helvetica-Bold'
+    ))
+
     styles.add(ParagraphStyle(
         'Footer',
         parent=styles['Normal'],
         fontSize=9,
         alignment=TA_CENTER,
-        textColor=colors.HexColor('#666666')
+        textColor=_C_GREY
     ))
 
     styles.add(ParagraphStyle(
@@ -106,32 +116,245 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
         leading=14
     ))
 
-    elements = []
+    return styles
 
-    # Header section with company info and INVOICE title
-    header_data = [
+
+@lru_cache(maxsize=1)
+def _get_table_styles():
+    """Build the TableStyles shared by every invoice and statement once.
+
+    Table.setStyle only reads a TableStyle's commands, so one instance
+    can style any number of tables.
+    """
+    items = [
+        ('BACKGROUND', (0, 0), (-1, 0), _C_BG),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('LINEBELOW', (0, 0), (-1, 0), 1, _C_LINE),
+        ('LINEBELOW', (0, -1), (-1, -1), 1, _C_LINE),
+        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ]
+    return {
+        'Header': TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ]),
+        'Details': TableStyle([
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('TEXTCOLOR', (0, 0), (0, -1), _C_GREY),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ]),
+        'DetailsRow': TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+        'Breakdown': TableStyle([
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('TEXTCOLOR', (0, 0), (0, -1), _C_GREY),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ]),
+        'Items': TableStyle(items),
+        # Bold total row with a rule above it
+        'ItemsWithTotal': TableStyle(items + [
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+            ('LINEABOVE', (0, -1), (-1, -1), 1, _C_LINE),
+        ]),
+        'Statement': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), _C_BG),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('LINEBELOW', (0, 0), (-1, 0), 1, _C_LINE),
+            ('LINEBELOW', (0, -1), (-1, -1), 1, _C_LINE),
+            ('ALIGN', (4, 0), (-1, -1), 'RIGHT'),
+        ]),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _format_work_date(work_date: str) -> str:
+    """Format an invoice_hours work date as 'Mon Jan 20'."""
+    return datetime.fromisoformat(work_date).strftime('%a %b %d')
+
+
+# Company address block under the company name, filled from business_info
+_COMPANY_INFO_TEMPLATE = "{address}<br/>{city}, {state} {zip}<br/>{phone}<br/>{email}"
+
+
+def _address_block(heading: str, bill_to: str, name: str, address: str, address2: str,
+                   city: str, state: str, zip_code: str) -> str:
+    """Bill To / Statement For markup, skipping any address lines not set."""
+    return '<br/>'.join(filter(None, [
+        heading,
+        bill_to and f"Attn: {bill_to}",
+        name,
+        address,
+        address2,
+        _city_state_zip(city, state, zip_code),
+    ]))
+
+
+def _city_state_zip(city: str, state: str, zip_code: str) -> str:
+    """'City, ST 12345', leaving out whichever parts are blank."""
+    state_zip = f"{state} {zip_code}" if state and zip_code else (state or zip_code or '')
+    if city and state_zip:
+        return f"{city}, {state_zip}"
+    return city or state_zip
+
+
+def _header_table(business: dict, title: str, title_style) -> 'Table':
+    """Company name and address on the left, document title on the right.
+
+    Flowables hold layout state once built, so a fresh Table is made per
+    document.
+    """
+    styles = _get_styles()
+    company_info = _COMPANY_INFO_TEMPLATE.format_map(business)
+    header_table = Table([
         [
             Paragraph(business['company_name'], styles['CompanyName']),
-            Paragraph('INVOICE', styles['InvoiceTitle'])
+            Paragraph(title, title_style)
         ],
-        [
-            Paragraph(
-                f"{business['address']}<br/>"
-                f"{business['city']}, {business['state']} {business['zip']}<br/>"
-                f"{business['phone']}<br/>"
-                f"{business['email']}",
-                styles['CompanyInfo']
-            ),
-            ''
-        ]
+        [Paragraph(company_info, styles['CompanyInfo']), '']
+    ], colWidths=_COL_HEADER)
+    header_table.setStyle(_get_table_styles()['Header'])
+    return header_table
+
+
+# Multi-line instructions entered in Business Setup become Paragraph breaks
+_NEWLINES_TO_BR = str.maketrans({'\n': '<br/>'})
+
+
+def _default_wire_info(banking: dict) -> str:
+    return (
+        f"Bank: {banking['bank_name']}\n"
+        f"Routing: {banking['routing_number']}\n"
+        f"Account: {banking['account_number']}"
+    )
+
+
+def _ach_lines(business: dict, banking: dict) -> list:
+    return [
+        "<b>ACH Transfer</b>",
+        f"Bank: {banking['bank_name']}",
+        f"Routing Number: {banking['routing_number']}",
+        f"Account Number: {banking['account_number']}",
     ]
 
-    header_table = Table(header_data, colWidths=[4*inch, 3*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    elements.append(header_table)
+
+def _domestic_wire_lines(business: dict, banking: dict) -> list:
+    wire_info = banking.get('domestic_wire_instructions') or _default_wire_info(banking)
+    return ["<b>Domestic Wire Transfer</b>", wire_info.translate(_NEWLINES_TO_BR)]
+
+
+def _wire_lines(business: dict, banking: dict) -> list:
+    wire_info = banking.get('wire_instructions') or _default_wire_info(banking)
+    return ["<b>Wire Transfer</b>", wire_info.translate(_NEWLINES_TO_BR)]
+
+
+def _check_lines(business: dict, banking: dict) -> list:
+    return [
+        "<b>Check</b>",
+        f"Make payable to: {business['company_name']}",
+        f"Mail to: {business['address']}, {business['city']}, {business['state']} {business['zip']}",
+    ]
+
+
+def _paypal_lines(business: dict, banking: dict) -> list:
+    paypal_email = banking.get('paypal_email') or business.get('email', '')
+    return ["<b>PayPal</b>", f"Send payment to: {paypal_email}"]
+
+
+def _credit_card_lines(business: dict, banking: dict) -> list:
+    cc_info = banking.get('credit_card_instructions') or 'Contact for credit card payment details.'
+    return ["<b>Credit Card</b>", cc_info.translate(_NEWLINES_TO_BR)]
+
+
+_PAYMENT_LINES = {
+    'ACH': _ach_lines,
+    'Domestic Wire': _domestic_wire_lines,
+    'Wire': _wire_lines,
+    'International Wire': _wire_lines,
+    'Check': _check_lines,
+    'PayPal': _paypal_lines,
+    'Credit Card': _credit_card_lines,
+}
+
+
+def _payment_text(payment_method: str, business: dict, banking: dict) -> str:
+    """Payment instructions markup for the given payment method."""
+    build = _PAYMENT_LINES.get(payment_method)
+    if build:
+        lines = build(business, banking)
+    else:
+        lines = [f"<b>{payment_method}</b>", "Contact for payment details."]
+    return '<br/>'.join(lines)
+
+
+def _write_pdf(output_path: Path, data: bytes):
+    """Write a finished PDF, creating its client folder only when missing.
+
+    Folders exist for every client after their first PDF, so try the write
+    first instead of issuing a mkdir on every generation.
+    """
+    try:
+        output_path.write_bytes(data)
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
+
+
+def _daily_line_items(daily_hours: list, rate: float) -> list:
+    """Date / Hours / Amount rows for each day on an hourly invoice."""
+    format_currency = db.format_currency
+    return [[_format_work_date(entry['work_date']), f"{entry['hours']:.2f}",
+             format_currency(entry['hours'] * rate)]
+            for entry in daily_hours]
+
+
+def generate_invoice_pdf(invoice_number: str) -> Path:
+    """Generate PDF for an invoice, return path to file."""
+    if not REPORTLAB_AVAILABLE:
+        raise ImportError("reportlab is required for PDF generation. Install with: pip install reportlab")
+
+    invoice = db.get_invoice(invoice_number)
+    if not invoice:
+        raise ValueError(f"Invoice {invoice_number} not found")
+
+    business = db.get_business_info()
+    if not business:
+        raise ValueError("Business info not configured. Go to Edit > Business Setup.")
+
+    banking = db.get_banking()
+    if not banking:
+        raise ValueError("Banking info not configured. Go to Edit > Business Setup.")
+
+    # Organize by client name
+    client_folder = db.get_pdfs_dir() / invoice['client_name'].replace(' ', '_')
+    output_path = client_folder / f"{invoice_number}.pdf"
+    # Rendered in memory and written once at the end: given a path, ReportLab
+    # truncates the file before serializing, so an error there would leave
+    # an empty PDF in place of the previous one
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        **_PAGE_MARGINS
+    )
+
+    styles = _get_styles()
+    table_styles = _get_table_styles()
+
+    elements = []
+
+    # Header section with company info and INVOICE title
+    elements.append(_header_table(business, 'INVOICE', styles['InvoiceTitle']))
     elements.append(Spacer(1, 0.3*inch))
 
     # Invoice details and Bill To section
@@ -142,14 +365,8 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
         ['Payment Terms:', invoice['payment_terms']],
     ]
 
-    invoice_table = Table(invoice_details, colWidths=[1.2*inch, 1.8*inch])
-    invoice_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#666666')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    invoice_table = Table(invoice_details, colWidths=_COL_DETAILS)
+    invoice_table.setStyle(table_styles['Details'])
 
     # Build client info - format:
     # Bill To:
@@ -158,28 +375,14 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
     # [address]
     # [address2] (if set)
     # [city], [state] [zip]
-    client_lines = ["<b>Bill To:</b>"]
-    if invoice.get('bill_to'):
-        client_lines.append(f"Attn: {invoice['bill_to']}")
-    client_lines.append(invoice['client_name'])
-    if invoice.get('client_address'):
-        client_lines.append(invoice['client_address'])
-    if invoice.get('client_address2'):
-        client_lines.append(invoice['client_address2'])
-    if invoice.get('client_city') or invoice.get('client_state') or invoice.get('client_zip'):
-        city_state_zip = ', '.join(filter(None, [
-            invoice.get('client_city'),
-            ' '.join(filter(None, [invoice.get('client_state'), invoice.get('client_zip')]))
-        ]))
-        if city_state_zip:
-            client_lines.append(city_state_zip)
-
-    client_info = Paragraph('<br/>'.join(client_lines), styles['ClientInfo'])
-
-    details_row = Table([[invoice_table, client_info]], colWidths=[3.5*inch, 3.5*inch])
-    details_row.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    client_info = Paragraph(_address_block(
+        "<b>Bill To:</b>", invoice.get('bill_to'), invoice['client_name'],
+        invoice.get('client_address'), invoice.get('client_address2'),
+        invoice.get('client_city'), invoice.get('client_state'), invoice.get('client_zip')
+    ), styles['ClientInfo'])
+
+    details_row = Table([[invoice_table, client_info]], colWidths=_COL_ROW)
+    details_row.setStyle(table_styles['DetailsRow'])
     elements.append(details_row)
     elements.append(Spacer(1, 0.4*inch))
 
@@ -208,36 +411,24 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
             ['Hours Worked:', f"{worked_hours:.2f} hrs"],
             ['Retainer Minimum:', f"{retainer_minimum:.2f} hrs"],
         ]
-        breakdown_table = Table(breakdown_data, colWidths=[1.5*inch, 2*inch])
-        breakdown_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#666666')),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ]))
+        breakdown_table = Table(breakdown_data, colWidths=_COL_BREAKDOWN)
+        breakdown_table.setStyle(table_styles['Breakdown'])
         elements.append(breakdown_table)
         elements.append(Spacer(1, 0.1*inch))
 
         # Daily hours detail (if available)
         if daily_hours:
             elements.append(Paragraph("<b>Daily Detail:</b>", styles['Normal']))
-            line_items = [['Date', 'Hours', 'Amount']]
-            for entry in daily_hours:
-                dt = datetime.fromisoformat(entry['work_date'])
-                date_str = dt.strftime('%a %b %d')
-                hrs = entry['hours']
-                amt = hrs * invoice['rate']
-                line_items.append([date_str, f"{hrs:.2f}", db.format_currency(amt)])
+            line_items = [['Date', 'Hours', 'Amount']] + _daily_line_items(daily_hours, invoice['rate'])
             # Billable total row
             line_items.append(['Billable Total', f"{invoice['quantity']:.2f}", db.format_currency(invoice['total'])])
-            col_widths = [2.5*inch, 1.5*inch, 3*inch]
+            col_widths = _COL_WIDTHS_ITEMS_DAILY
         else:
             line_items = [
                 ['Description', 'Rate', 'Hours', 'Amount'],
                 ['Retainer Billing', db.format_currency(invoice['rate']), f"{invoice['quantity']:.2f}", db.format_currency(invoice['total'])]
             ]
-            col_widths = [3.5*inch, 1.25*inch, 1*inch, 1.25*inch]
+            col_widths = _COL_WIDTHS_ITEMS_FLAT
     elif invoice.get('billing_type') == 'weekly_flat':
         # Weekly flat rate invoice - per-week line items with date ranges
         period = ""
@@ -264,86 +455,35 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
                 db.format_currency(weekly_rate),
             ])
         line_items.append(['Total', '', '', db.format_currency(invoice['total'])])
-        col_widths = [1*inch, 2.75*inch, 1.25*inch, 1.5*inch]
+        col_widths = _COL_WIDTHS_ITEMS_WEEKLY
     elif daily_hours:
         # Standard invoice with daily breakdown
         elements.append(Paragraph(f"<b>{invoice['description']}</b> - {db.format_currency(invoice['rate'])}/hr", styles['Normal']))
         elements.append(Spacer(1, 0.05*inch))
-        line_items = [['Date', 'Hours', 'Amount']]
-        for entry in daily_hours:
-            dt = datetime.fromisoformat(entry['work_date'])
-            date_str = dt.strftime('%a %b %d')
-            hrs = entry['hours']
-            amt = hrs * invoice['rate']
-            line_items.append([date_str, f"{hrs:.2f}", db.format_currency(amt)])
+        line_items = [['Date', 'Hours', 'Amount']] + _daily_line_items(daily_hours, invoice['rate'])
         line_items.append(['Total', f"{invoice['quantity']:.2f}", db.format_currency(invoice['total'])])
-        col_widths = [2.5*inch, 1.5*inch, 3*inch]
+        col_widths = _COL_WIDTHS_ITEMS_DAILY
     else:
         # Standard invoice without daily breakdown
         line_items = [
             ['Description', 'Rate', 'Hours', 'Amount'],
             [invoice['description'], db.format_currency(invoice['rate']), f"{invoice['quantity']:.2f}", db.format_currency(invoice['total'])]
         ]
-        col_widths = [3.5*inch, 1.25*inch, 1*inch, 1.25*inch]
+        col_widths = _COL_WIDTHS_ITEMS_FLAT
 
     items_table = Table(line_items, colWidths=col_widths)
-    table_style = [
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f5')),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('LINEBELOW', (0, 0), (-1, 0), 1, colors.HexColor('#dddddd')),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.HexColor('#dddddd')),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-    ]
     is_weekly_flat = invoice.get('billing_type') == 'weekly_flat'
     if daily_hours or is_retainer or is_weekly_flat:
-        table_style.append(('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'))
-        table_style.append(('LINEABOVE', (0, -1), (-1, -1), 1, colors.HexColor('#dddddd')))
-    items_table.setStyle(TableStyle(table_style))
+        items_table.setStyle(table_styles['ItemsWithTotal'])
+    else:
+        items_table.setStyle(table_styles['Items'])
     elements.append(items_table)
     elements.append(Spacer(1, 0.15*inch))
 
     # Payment instructions
     elements.append(Paragraph('Payment Instructions', styles['SectionHeader']))
 
-    if invoice['payment_method'] == 'ACH':
-        payment_text = (
-            f"<b>ACH Transfer</b><br/>"
-            f"Bank: {banking['bank_name']}<br/>"
-            f"Routing Number: {banking['routing_number']}<br/>"
-            f"Account Number: {banking['account_number']}"
-        )
-    elif invoice['payment_method'] == 'Domestic Wire':
-        wire_info = banking.get('domestic_wire_instructions') or (
-            f"Bank: {banking['bank_name']}\n"
-            f"Routing: {banking['routing_number']}\n"
-            f"Account: {banking['account_number']}"
-        )
-        payment_text = f"<b>Domestic Wire Transfer</b><br/>{wire_info.replace(chr(10), '<br/>')}"
-    elif invoice['payment_method'] in ('Wire', 'International Wire'):
-        wire_info = banking.get('wire_instructions') or (
-            f"Bank: {banking['bank_name']}\n"
-            f"Routing: {banking['routing_number']}\n"
-            f"Account: {banking['account_number']}"
-        )
-        payment_text = f"<b>Wire Transfer</b><br/>{wire_info.replace(chr(10), '<br/>')}"
-    elif invoice['payment_method'] == 'Check':
-        payment_text = (
-            f"<b>Check</b><br/>"
-            f"Make payable to: {business['company_name']}<br/>"
-            f"Mail to: {business['address']}, {business['city']}, {business['state']} {business['zip']}"
-        )
-    elif invoice['payment_method'] == 'PayPal':
-        paypal_email = banking.get('paypal_email') or business.get('email', '')
-        payment_text = f"<b>PayPal</b><br/>Send payment to: {paypal_email}"
-    elif invoice['payment_method'] == 'Credit Card':
-        cc_info = banking.get('credit_card_instructions') or 'Contact for credit card payment details.'
-        payment_text = f"<b>Credit Card</b><br/>{cc_info.replace(chr(10), '<br/>')}"
-    else:
-        payment_text = f"<b>{invoice['payment_method']}</b><br/>Contact for payment details."
-
+    payment_text = _payment_text(invoice['payment_method'], business, banking)
     elements.append(Paragraph(payment_text, styles['PaymentInfo']))
     elements.append(Spacer(1, 0.25*inch))
 
@@ -355,6 +495,7 @@ def generate_invoice_pdf(invoice_number: str) -> Path:
     ))
 
     doc.build(elements)
+    _write_pdf(output_path, buffer.getvalue())
     return output_path
 
 
@@ -364,20 +505,10 @@ def generate_statement_pdf(client_id: int) -> Path:
         raise ImportError("reportlab is required for PDF generation. Install with: pip install reportlab")
 
     # Get client info with address
-    import db as db_module
-    conn = db_module.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT company_name, contact_name, bill_to, address, address2, city, state, zip, email
-        FROM clients WHERE id = ?
-    """, (client_id,))
-    row = cursor.fetchone()
-    conn.close()
-
-    if not row:
+    client = db.get_client_billing(client_id)
+    if not client:
         raise ValueError(f"Client {client_id} not found")
 
-    client = dict(row)
     client_name = client['contact_name'] or client['company_name']
 
     # Get outstanding invoices
@@ -393,112 +524,24 @@ def generate_statement_pdf(client_id: int) -> Path:
 
     # Output path
     client_folder = db.get_pdfs_dir() / (client['company_name'] or client_name).replace(' ', '_')
-    client_folder.mkdir(exist_ok=True)
     statement_date = datetime.now().strftime('%Y-%m-%d')
     output_path = client_folder / f"Statement_{statement_date}.pdf"
 
+    # Rendered in memory for the same reason as invoices
+    buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        str(output_path),
+        buffer,
         pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
+        **_PAGE_MARGINS
     )
 
-    styles = getSampleStyleSheet()
-
-    # Custom styles (same as invoice)
-    styles.add(ParagraphStyle(
-        'CompanyName',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=6,
-        textColor=colors.HexColor('#1a1a1a')
-    ))
-
-    styles.add(ParagraphStyle(
-        'CompanyInfo',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#666666'),
-        leading=12
-    ))
-
-    styles.add(ParagraphStyle(
-        'StatementTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        alignment=TA_RIGHT,
-        textColor=colors.HexColor('#333333')
-    ))
-
-    styles.add(ParagraphStyle(
-        'SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=11,
-        spaceBefore=12,
-        spaceAfter=6,
-        textColor=colors.HexColor('#333333')
-    ))
-
-    styles.add(ParagraphStyle(
-        'ClientInfo',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=14
-    ))
-
-    styles.add(ParagraphStyle(
-        'TotalDue',
-        parent=styles['Normal'],
-        fontSize=14,
-        alignment=TA_RIGHT,
-        textColor=colors.HexColor('#1a1a1a'),
-        fontName='Helvetica-Bold'
-    ))
-
-    styles.add(ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#666666')
-    ))
-
-    styles.add(ParagraphStyle(
-        'PaymentInfo',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=14
-    ))
+    styles = _get_styles()
+    table_styles = _get_table_styles()
 
     elements = []
 
     # Header section
-    header_data = [
-        [
-            Paragraph(business['company_name'], styles['CompanyName']),
-            Paragraph('STATEMENT', styles['StatementTitle'])
-        ],
-        [
-            Paragraph(
-                f"{business['address']}<br/>"
-                f"{business['city']}, {business['state']} {business['zip']}<br/>"
-                f"{business['phone']}<br/>"
-                f"{business['email']}",
-                styles['CompanyInfo']
-            ),
-            ''
-        ]
-    ]
-
-    header_table = Table(header_data, colWidths=[4*inch, 3*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    elements.append(header_table)
+    elements.append(_header_table(business, 'STATEMENT', styles['StatementTitle']))
     elements.append(Spacer(1, 0.3*inch))
 
     # Statement details and client info
@@ -507,52 +550,29 @@ def generate_statement_pdf(client_id: int) -> Path:
         ['Account:', client_name],
     ]
 
-    details_table = Table(statement_details, colWidths=[1.2*inch, 1.8*inch])
-    details_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#666666')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    details_table = Table(statement_details, colWidths=_COL_DETAILS)
+    details_table.setStyle(table_styles['Details'])
 
     # Build client address
-    client_lines = ["<b>Statement For:</b>"]
-    if client.get('bill_to'):
-        client_lines.append(f"Attn: {client['bill_to']}")
-    client_lines.append(client['company_name'] or client_name)
-    if client.get('address'):
-        client_lines.append(client['address'])
-    if client.get('address2'):
-        client_lines.append(client['address2'])
-    if client.get('city') or client.get('state') or client.get('zip'):
-        city_state_zip = ', '.join(filter(None, [
-            client.get('city'),
-            ' '.join(filter(None, [client.get('state'), client.get('zip')]))
-        ]))
-        if city_state_zip:
-            client_lines.append(city_state_zip)
-
-    client_info = Paragraph('<br/>'.join(client_lines), styles['ClientInfo'])
-
-    details_row = Table([[details_table, client_info]], colWidths=[3.5*inch, 3.5*inch])
-    details_row.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    client_info = Paragraph(_address_block(
+        "<b>Statement For:</b>", client.get('bill_to'), client['company_name'] or client_name,
+        client.get('address'), client.get('address2'),
+        client.get('city'), client.get('state'), client.get('zip')
+    ), styles['ClientInfo'])
+
+    details_row = Table([[details_table, client_info]], colWidths=_COL_ROW)
+    details_row.setStyle(table_styles['DetailsRow'])
     elements.append(details_row)
     elements.append(Spacer(1, 0.4*inch))
 
     # Outstanding invoices table
     elements.append(Paragraph('Outstanding Invoices', styles['SectionHeader']))
 
-    today = datetime.now().date()
     line_items = [['Invoice #', 'Date', 'Due Date', 'Status', 'Total', 'Paid', 'Balance Due']]
     total_outstanding = 0
 
     for inv in invoices:
-        due_date = datetime.fromisoformat(inv['due_date']).date()
-        days_overdue = (today - due_date).days
-
+        days_overdue = inv['days_overdue']
         if days_overdue > 0:
             status = f"{days_overdue} days overdue"
         elif days_overdue == 0:
@@ -571,18 +591,8 @@ def generate_statement_pdf(client_id: int) -> Path:
         ])
         total_outstanding += inv['outstanding']
 
-    col_widths = [0.9*inch, 0.8*inch, 0.8*inch, 1.2*inch, 0.85*inch, 0.7*inch, 0.85*inch]
-    items_table = Table(line_items, colWidths=col_widths)
-    items_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f5')),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('LINEBELOW', (0, 0), (-1, 0), 1, colors.HexColor('#dddddd')),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.HexColor('#dddddd')),
-        ('ALIGN', (4, 0), (-1, -1), 'RIGHT'),
-    ]))
+    items_table = Table(line_items, colWidths=_COL_WIDTHS_STATEMENT)
+    items_table.setStyle(table_styles['Statement'])
     elements.append(items_table)
     elements.append(Spacer(1, 0.2*inch))
 
@@ -596,12 +606,7 @@ def generate_statement_pdf(client_id: int) -> Path:
     # Payment instructions (if banking info available)
     if banking:
         elements.append(Paragraph('Payment Instructions', styles['SectionHeader']))
-        payment_text = (
-            f"<b>ACH Transfer</b><br/>"
-            f"Bank: {banking['bank_name']}<br/>"
-            f"Routing Number: {banking['routing_number']}<br/>"
-            f"Account Number: {banking['account_number']}"
-        )
+        payment_text = _payment_text('ACH', business, banking)
         elements.append(Paragraph(payment_text, styles['PaymentInfo']))
         elements.append(Spacer(1, 0.25*inch))
 
@@ -613,4 +618,5 @@ def generate_statement_pdf(client_id: int) -> Path:
     ))
 
     doc.build(elements)
+    _write_pdf(output_path, buffer.getvalue())
     return output_path
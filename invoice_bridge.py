@@ -1,22 +1,44 @@
 """Create invoices from time entries."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import db
 
 
+_TERMS_DAYS = {
+    'Due on Receipt': 0,
+    'Net 7': 7,
+    'Net 15': 15,
+    'Net 30': 30
+}
+
+
 def calculate_due_date(terms: str, issue_date: datetime) -> datetime:
     """Calculate due date from payment terms."""
-    terms_days = {
-        'Due on Receipt': 0,
-        'Net 7': 7,
-        'Net 15': 15,
-        'Net 30': 30
-    }
-    days = terms_days.get(terms, 30)
+    days = _TERMS_DAYS.get(terms, 30)
     return issue_date + timedelta(days=days)
 
 
+# Renders PDFs for background_pdf=True. One worker, so renders run in the
+# order invoices were created; the thread gets its own db connection.
+_PDF_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='invoice-pdf')
+
+
+def _render_pdf(invoice_number: str) -> Optional[str]:
+    """Generate the invoice PDF. Returns its path, or None without reportlab.
+
+    Other rendering errors propagate, so a background render reports them
+    through its future instead of printing from the worker thread.
+    """
+    try:
+        from generate_pdf import generate_invoice_pdf
+        return str(generate_invoice_pdf(invoice_number))
+    except ImportError:
+        return None  # reportlab not installed
+
+
 def create_invoice(
     client: Dict,
     entries: List[Dict],
@@ -24,13 +46,15 @@ def create_invoice(
     payment_terms: str,
     payment_method: str,
     retainer_info: Optional[Dict] = None,
-    weekly_flat_rate_info: Optional[Dict] = None
+    weekly_flat_rate_info: Optional[Dict] = None,
+    background_pdf: bool = False
 ) -> Dict:
     """Create an invoice from time entries.
 
     Args:
         client: Client dict with id, hourly_rate, retainer_enabled, etc.
-        entries: List of time entry dicts
+        entries: List of saved time entry dicts (daily hours are summed
+            from their time_entries rows by id)
         description: Invoice description
         payment_terms: Payment terms string
         payment_method: Payment method string
@@ -41,20 +65,24 @@ def create_invoice(
             - weekly_rate: float
             - period_start: str (YYYY-MM-DD)
             - period_end: str (YYYY-MM-DD)
+        background_pdf: Render the PDF on a worker thread instead of before
+            returning, so the UI stays responsive
 
     Returns dict with:
         success: bool
         invoice_number: str (if success)
         pdf_path: str (if success and PDF generation available)
+        pdf_future: Future resolving to pdf_path, or holding the rendering
+            error (if success and background_pdf; replaces pdf_path)
         error: str (if not success)
     """
-    conn = db.get_connection()
-
     try:
-        cursor = conn.cursor()
-
-        # Calculate totals
-        total_seconds = sum(e['duration_seconds'] or 0 for e in entries)
+        # Calculate totals, collecting the entry ids in the same pass
+        total_seconds = 0
+        entry_ids = []
+        for e in entries:
+            entry_ids.append(e['id'])
+            total_seconds += e['duration_seconds'] or 0
         worked_hours = total_seconds / 3600
 
         # Determine billing type, rate, and totals
@@ -87,63 +115,64 @@ def create_invoice(
             billable_hours = round(billable_hours, 2)
             total_amount = round(billable_hours * rate, 2)
 
-        # Generate invoice number and dates
-        invoice_number = db.get_next_invoice_number()
+        # Generate dates
         date_issued = datetime.now()
         due_date = calculate_due_date(payment_terms, date_issued)
 
-        # Create invoice record
-        cursor.execute("""
-            INSERT INTO invoices
-            (invoice_number, client_id, date_issued, due_date, description,
-             billing_type, rate, quantity, total, payment_terms, payment_method, status,
-             is_retainer_invoice, retainer_hours_applied, overage_hours,
-             period_start, period_end)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'unpaid', ?, ?, ?, ?, ?)
-        """, (
-            invoice_number,
-            client['id'],
-            date_issued.strftime('%Y-%m-%d'),
-            due_date.strftime('%Y-%m-%d'),
-            description,
-            billing_type,
-            rate,
-            billable_hours,
-            total_amount,
-            payment_terms,
-            payment_method,
-            1 if is_retainer_invoice else 0,
-            retainer_hours_applied,
-            overage_hours,
-            period_start,
-            period_end
-        ))
-
-        # Aggregate hours by date
-        daily_hours = {}
-        for entry in entries:
-            dt = datetime.fromisoformat(entry['start_time'])
-            date_str = dt.strftime('%Y-%m-%d')
-            hours = (entry['duration_seconds'] or 0) / 3600
-            daily_hours[date_str] = daily_hours.get(date_str, 0) + hours
-
-        # Insert daily hours
-        for work_date, hours in sorted(daily_hours.items()):
-            cursor.execute("""
+        with db.tx() as conn:
+            # Create invoice record, numbering it in the same statement
+            invoice_number = conn.execute("""
+                INSERT INTO invoices
+                (invoice_number, client_id, date_issued, due_date, description,
+                 billing_type, rate, quantity, total, payment_terms, payment_method, status,
+                 is_retainer_invoice, retainer_hours_applied, overage_hours,
+                 period_start, period_end)
+                VALUES (""" + db.NEXT_INVOICE_NUMBER_SQL + """,
+                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'unpaid', ?, ?, ?, ?, ?)
+                RETURNING invoice_number
+            """, (
+                client['id'],
+                date_issued.strftime('%Y-%m-%d'),
+                due_date.strftime('%Y-%m-%d'),
+                description,
+                billing_type,
+                rate,
+                billable_hours,
+                total_amount,
+                payment_terms,
+                payment_method,
+                1 if is_retainer_invoice else 0,
+                retainer_hours_applied,
+                overage_hours,
+                period_start,
+                period_end
+            )).fetchone()[0]
+
+            # Insert hours aggregated by date
+            # Ids go in as one JSON array, so the statement text stays fixed
+            # (and cached) and long invoices can't hit SQLite's parameter limit
+            conn.execute("""
                 INSERT INTO invoice_hours (invoice_number, work_date, hours)
-                VALUES (?, ?, ?)
-            """, (invoice_number, work_date, hours))
-
-        conn.commit()
-        conn.close()
+                SELECT ?, date(start_time) AS work_date,
+                       SUM(COALESCE(duration_seconds, 0)) / 3600.0
+                FROM time_entries
+                WHERE id IN (SELECT value FROM json_each(?))
+                GROUP BY work_date
+                ORDER BY work_date
+            """, (invoice_number, json.dumps(entry_ids)))
+
+        # The invoice is committed, so the PDF can be rendered from any thread
+        if background_pdf:
+            return {
+                'success': True,
+                'invoice_number': invoice_number,
+                'pdf_future': _PDF_POOL.submit(_render_pdf, invoice_number)
+            }
 
         # Try to generate PDF
         pdf_path = None
         try:
-            from generate_pdf import generate_invoice_pdf
-            pdf_path = str(generate_invoice_pdf(invoice_number))
-        except ImportError:
-            pass  # reportlab not installed
+            pdf_path = _render_pdf(invoice_number)
         except Exception as e:
             print(f"PDF generation error: {e}")
 
@@ -154,5 +183,4 @@ def create_invoice(
         }
 
     except Exception as e:
-        conn.close()
         return {'success': False, 'error': str(e)}
@@ -27,8 +27,14 @@ try:
 except ImportError:
     PYWINSTYLES_AVAILABLE = False
 
-# Single instance port
+# Single instance port (only carries SHOW requests; the lock below decides
+# whether another instance is running)
 SINGLE_INSTANCE_PORT = 47839
+SINGLE_INSTANCE_MUTEX = "Global\\TimerTool_SingleInstance"
+ERROR_ALREADY_EXISTS = 183
+
+# Held for the life of the process once acquired
+_instance_lock = None
 
 # Try to import pystray for system tray support
 try:
@@ -60,20 +66,70 @@ def create_tray_icon():
     return image
 
 
+def _acquire_instance_lock() -> bool:
+    """Take the single-instance lock. Returns False if another instance holds it."""
+    global _instance_lock
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        handle = kernel32.CreateMutexW(None, False, SINGLE_INSTANCE_MUTEX)
+        if not handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            kernel32.CloseHandle(handle)
+            return False
+        _instance_lock = handle
+    else:
+        import fcntl
+        fd = os.open(db.get_data_dir() / "timertool.lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        _instance_lock = fd
+    return True
+
+
+def _release_instance_lock():
+    """Drop the single-instance lock so a relaunch can start."""
+    global _instance_lock
+    if _instance_lock is None:
+        return
+    if sys.platform == 'win32':
+        import ctypes
+        ctypes.WinDLL('kernel32').CloseHandle(_instance_lock)
+    else:
+        os.close(_instance_lock)  # Closing the descriptor releases the flock
+    _instance_lock = None
+
+
 def check_single_instance():
     """Check if another instance is running. Returns True if we should continue, False if another instance exists."""
     try:
-        # Try to connect to existing instance
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.connect(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        sock.send(b'SHOW')
-        sock.close()
-        return False  # Another instance exists, we sent it SHOW command
-    except ConnectionRefusedError:
-        return True  # No other instance, we can start
+        if _acquire_instance_lock():
+            return True  # No other instance, we can start
     except Exception:
         return True  # Error, try to start anyway
 
+    try:
+        # Ask the running instance to come to the front
+        with socket.create_connection(('127.0.0.1', SINGLE_INSTANCE_PORT), timeout=2) as sock:
+            sock.sendall(b'SHOW')
+    except OSError:
+        pass  # Still starting up; it will show itself anyway
+    return False
+
+
+def startup_backup():
+    """Back up the database on startup (keeps last 10) and upload it to S3 if configured."""
+    backup_path = db.backup_database()
+    if backup_path:
+        # The upload can sit in retry backoff for a while; a daemon thread
+        # doesn't keep the process alive for it after the window closes
+        threading.Thread(target=db.upload_to_s3, args=(backup_path,),
+                         name='s3-upload', daemon=True).start()
+
 
 class TimerApp:
     """Main application class."""
@@ -265,6 +321,11 @@ class TimerApp:
         # Stop any running timer (saves to recovery)
         if self.engine.state == 'running':
             self.engine.pause()
+        # Stop answering SHOW so a relaunch can take over the port
+        try:
+            self._listener_socket.close()
+        except Exception:
+            pass
         self.root.quit()
         self.root.destroy()
 
@@ -283,17 +344,19 @@ def main():
     # Initialize database
     db.init_db()
 
-    # Backup database on startup (keeps last 10)
-    backup_path = db.backup_database()
-
-    # Upload to S3 if configured
-    if backup_path:
-        db.upload_to_s3(backup_path)
+    # Back up and upload while the window builds. The local backup is not a
+    # daemon, so quitting right after launch still finishes the backup file
+    # instead of leaving a truncated one behind.
+    threading.Thread(target=startup_backup, name='startup-backup').start()
 
     # Create and run app
     app = TimerApp()
     app.run()
 
+    # The window is gone; let a relaunch start even if the backup thread is
+    # still finishing
+    _release_instance_lock()
+
 
 if __name__ == '__main__':
     main()
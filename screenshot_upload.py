@@ -1,5 +1,7 @@
 """Handles uploading screenshots to remote destinations."""
 
+import os
+import re
 import subprocess
 import shutil
 from pathlib import Path
@@ -13,10 +15,22 @@ try:
 except ImportError:
     KEYRING_AVAILABLE = False
 
+# Server and share components of a UNC path (\\server\share\folder)
+_UNC_SHARE_RE = re.compile(r'^\\*([^\\]+)\\([^\\]+)')
 
-def upload_screenshot(client_id: int, local_path: Path) -> bool:
-    """Upload screenshot to remote if configured. Returns True on success."""
-    client = db.get_client(client_id)
+# (share, username) pairs already connected with net use this session, so
+# each upload doesn't delete and re-authenticate the connection
+_authed_shares = set()
+
+
+def upload_screenshot(client_id: int, local_path: Path, client: Optional[dict] = None) -> bool:
+    """Upload screenshot to remote if configured. Returns True on success.
+
+    Pass ``client`` when the caller already loaded the row, to skip reading
+    it again.
+    """
+    if client is None:
+        client = db.get_client(client_id)
 
     if not client or not client.get('push_screenshots_remote'):
         return True  # No remote configured, that's fine
@@ -30,6 +44,70 @@ def upload_screenshot(client_id: int, local_path: Path) -> bool:
     return False
 
 
+def _fast_copy(src: Path, dst: Path):
+    """Copy a file letting the OS move the bytes, falling back to shutil."""
+    if os.name == 'nt':
+        import ctypes
+        # CopyFileExW copies data and timestamps without a user-space buffer
+        if ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+            return
+    elif hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as s, open(dst, 'wb') as d:
+                remaining = os.fstat(s.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _unc_password(client: dict) -> Optional[str]:
+    """Get the client's UNC password from keyring, or None."""
+    if not KEYRING_AVAILABLE:
+        return None
+    try:
+        return keyring.get_password("timertool", f"client_{client['id']}_unc")
+    except Exception:
+        return None
+
+
+def _net_use(share: str, username: str, password: str) -> bool:
+    """(Re)connect to a share with credentials. Returns True on success."""
+    try:
+        # Delete existing connection first (ignore errors)
+        subprocess.run(
+            ['net', 'use', share, '/delete', '/y'],
+            capture_output=True,
+            timeout=10,
+            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        )
+    except Exception:
+        pass
+
+    try:
+        # Connect with credentials
+        result = subprocess.run(
+            ['net', 'use', share, f'/user:{username}', password],
+            capture_output=True,
+            timeout=30,
+            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        )
+        if result.returncode != 0:
+            print(f"net use failed: {result.stderr.decode()}")
+            return False
+    except subprocess.SubprocessError as e:
+        print(f"net use error: {e}")
+        return False
+    return True
+
+
 def _upload_unc(client: dict, local_path: Path) -> bool:
     """Upload via UNC path using Windows net use."""
     unc_path = client.get('screenshot_unc_path')
@@ -38,53 +116,37 @@ def _upload_unc(client: dict, local_path: Path) -> bool:
     if not unc_path:
         return False
 
-    # Get password from keyring
-    password = None
-    if KEYRING_AVAILABLE and username:
-        try:
-            password = keyring.get_password("timertool", f"client_{client['id']}_unc")
-        except Exception:
-            pass
+    # Extract server share from path (\\server\share\folder -> \\server\share)
+    share = None
+    if username:
+        m = _UNC_SHARE_RE.match(unc_path)
+        if m:
+            share = f"\\\\{m.group(1)}\\{m.group(2)}"
+    session = (share, username)
 
-    # Authenticate with net use (if credentials provided)
-    if username and password:
-        # Extract server share from path (\\server\share\folder -> \\server\share)
-        parts = unc_path.strip('\\').split('\\')
-        if len(parts) >= 2:
-            share = f"\\\\{parts[0]}\\{parts[1]}"
-            try:
-                # Delete existing connection first (ignore errors)
-                subprocess.run(
-                    ['net', 'use', share, '/delete', '/y'],
-                    capture_output=True,
-                    timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                )
-            except Exception:
-                pass
-
-            try:
-                # Connect with credentials
-                result = subprocess.run(
-                    ['net', 'use', share, f'/user:{username}', password],
-                    capture_output=True,
-                    timeout=30,
-                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                )
-                if result.returncode != 0:
-                    print(f"net use failed: {result.stderr.decode()}")
-                    return False
-            except subprocess.SubprocessError as e:
-                print(f"net use error: {e}")
+    # Authenticate with net use (if credentials provided), once per session
+    if share and session not in _authed_shares:
+        password = _unc_password(client)
+        if password:
+            if not _net_use(share, username, password):
                 return False
+            _authed_shares.add(session)
 
     # Copy file to remote
-    try:
-        remote_dir = Path(unc_path)
-        remote_dir.mkdir(parents=True, exist_ok=True)
-        remote_file = remote_dir / local_path.name
-        shutil.copy2(local_path, remote_file)
-        return True
-    except Exception as e:
-        print(f"Screenshot upload failed: {e}")
-        return False
+    for attempt in (1, 2):
+        try:
+            remote_dir = Path(unc_path)
+            remote_dir.mkdir(parents=True, exist_ok=True)
+            remote_file = remote_dir / local_path.name
+            _fast_copy(local_path, remote_file)
+            return True
+        except Exception as e:
+            # The remembered connection may have dropped; reconnect and retry once
+            if attempt == 1 and session in _authed_shares:
+                _authed_shares.discard(session)
+                password = _unc_password(client)
+                if password and _net_use(share, username, password):
+                    _authed_shares.add(session)
+                    continue
+            print(f"Screenshot upload failed: {e}")
+            return False
@@ -38,6 +38,167 @@ def temp_db():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+class TestConnection:
+    """Test the shared connection."""
+
+    def test_connection_is_reused(self, temp_db):
+        """Test that helpers share one connection per thread."""
+        assert db.get_connection() is db.get_connection()
+
+    def test_connection_uses_wal(self, temp_db):
+        """Test that new connections are switched to WAL journaling."""
+        mode = db.get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == 'wal'
+
+    def test_close_keeps_connection_usable(self, temp_db):
+        """Test that close() from legacy callers doesn't break later calls."""
+        conn = db.get_connection()
+        conn.close()
+        db.set_setting('after_close', 'ok')
+        assert db.get_setting('after_close') == 'ok'
+
+    def test_close_discards_uncommitted_changes(self, temp_db):
+        """Test that close() still rolls back an open transaction."""
+        conn = db.get_connection()
+        conn.execute("INSERT INTO settings (key, value) VALUES ('pending', 'x')")
+        conn.close()
+        assert db.get_setting('pending', 'missing') == 'missing'
+
+
+class TestSchema:
+    """Test schema creation and migration."""
+
+    def test_init_sets_user_version(self, temp_db):
+        """Test that init_db records the schema version."""
+        version = db.get_connection().execute("PRAGMA user_version").fetchone()[0]
+        assert version == db.SCHEMA_VERSION
+
+    def test_init_adds_missing_columns_to_old_tables(self, temp_db):
+        """Test that an older clients table gets the newer columns."""
+        import sqlite3
+        legacy_path = Path(temp_db) / "legacy.db"
+        # Built outside db.get_connection(), which would bring it up to date
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("""
+            CREATE TABLE clients (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT NOT NULL,
+                contact_name TEXT,
+                address TEXT,
+                city TEXT,
+                state TEXT,
+                zip TEXT,
+                email TEXT,
+                payment_preference TEXT
+            )
+        """)
+        conn.execute("INSERT INTO clients (company_name, contact_name) VALUES ('Old Co', 'Old')")
+        conn.commit()
+        conn.close()
+
+        db.DB_PATH = legacy_path
+        db.init_db()
+
+        client = db.get_clients()[0]
+        assert client['display_name'] == "Old (Old Co)"
+        assert client['track_activity'] == 1
+        assert client['retainer_enabled'] == 0
+
+    def test_init_rebuilds_invoice_hours(self, temp_db):
+        """Test that an old rowid invoice_hours table is rebuilt keyed by day."""
+        conn = db.get_connection()
+        conn.executescript("""
+            DROP TABLE invoice_hours;
+            CREATE TABLE invoice_hours (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                invoice_number TEXT NOT NULL,
+                work_date TEXT NOT NULL,
+                hours REAL NOT NULL
+            );
+            INSERT INTO invoice_hours (invoice_number, work_date, hours) VALUES
+                ('INV-0001', '2025-01-02', 1.0),
+                ('INV-0001', '2025-01-01', 2.0),
+                ('INV-0001', '2025-01-02', 0.5);
+            PRAGMA user_version = 0;
+        """)
+
+        db.init_db()
+
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'invoice_hours'").fetchone()[0]
+        assert 'WITHOUT ROWID' in sql
+        assert db.get_invoice_hours('INV-0001') == [
+            {'work_date': '2025-01-01', 'hours': 2.0},
+            {'work_date': '2025-01-02', 'hours': 1.5},
+        ]
+
+    def test_init_backfills_null_client_flags(self, temp_db):
+        """Test that NULL client flags from old rows are replaced with defaults."""
+        conn = db.get_connection()
+        client_id = db.save_client("Nulls", "", 100.0)
+        conn.execute("""
+            UPDATE clients SET hourly_rate = NULL, favorite = NULL, archived = NULL,
+                               track_activity = NULL, screenshot_keep_local = NULL
+            WHERE id = ?
+        """, (client_id,))
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+
+        db.init_db()
+
+        client = db.get_client(client_id)
+        assert client['hourly_rate'] == 0
+        assert client['favorite'] == 0
+        assert client['archived'] == 0
+        assert client['track_activity'] == 1
+        assert client['screenshot_keep_local'] == 1
+        assert db.toggle_client_favorite(client_id) is True
+
+    def test_first_connection_initializes_schema(self, temp_db):
+        """Test that opening a new database creates the schema without init_db()."""
+        db.DB_PATH = Path(temp_db) / "fresh.db"
+        assert db.get_setting('auto_save_interval_seconds') == '30'
+
+    def test_init_db_is_idempotent(self, temp_db):
+        """Test that re-running init_db keeps existing data."""
+        db.set_setting('keep_me', 'yes')
+        db.init_db()
+        assert db.get_setting('keep_me') == 'yes'
+
+
+class TestBackup:
+    """Test database backups."""
+
+    def test_backup_contains_data(self, temp_db):
+        """Test that a backup is a readable copy of the live database."""
+        import sqlite3
+        db.save_client("Backed Up", "", 100.0)
+
+        backup_path = db.backup_database()
+        assert backup_path is not None
+
+        conn = sqlite3.connect(backup_path)
+        names = [row[0] for row in conn.execute("SELECT contact_name FROM clients")]
+        conn.close()
+        assert names == ["Backed Up"]
+
+    def test_backup_keeps_newest(self, temp_db):
+        """Test that only the newest N backups are kept."""
+        backups_dir = db.get_backups_dir()
+        for day in range(1, 6):
+            (backups_dir / f"invoices_2020010{day}_000000.db").write_bytes(b"")
+        (backups_dir / "notes.txt").write_text("keep me")
+
+        backup_path = db.backup_database(keep_count=3)
+
+        remaining = sorted(p.name for p in backups_dir.iterdir())
+        assert remaining == [
+            "invoices_20200104_000000.db",
+            "invoices_20200105_000000.db",
+            backup_path.name,
+            "notes.txt",
+        ]
+
+
 class TestClients:
     """Test client CRUD operations."""
 
@@ -78,6 +239,68 @@ class TestClients:
         clients = db.get_clients()
         assert len(clients) == 2
 
+    def test_client_display_names(self, temp_db):
+        """Test name/display_name derivation from contact and company."""
+        both = db.save_client(" Jane ", "Acme ", 100.0)
+        contact_only = db.save_client("Bob", "", 100.0)
+        company_only = db.save_client("", "Globex", 100.0)
+
+        client = db.get_client(both)
+        assert client['name'] == " Jane "
+        assert client['display_name'] == "Jane (Acme)"
+        assert db.get_client(contact_only)['display_name'] == "Bob"
+        assert db.get_client(company_only)['name'] == "Globex"
+        assert db.get_client(company_only)['display_name'] == "Globex"
+
+    def test_bulk_save_in_transaction(self, temp_db):
+        """Test saving several clients inside one tx() block."""
+        with db.tx() as conn:
+            ids = [db.save_client(f"Client {i}", "", 50.0, conn=conn) for i in range(3)]
+            db.archive_client(ids[0], conn=conn)
+
+        assert len(db.get_clients()) == 2
+        assert db.get_client(ids[0])['archived'] == 1
+
+    def test_save_clients_bulk(self, temp_db):
+        """Test importing several clients in one call."""
+        count = db.save_clients_bulk([
+            {'contact_name': "Ann", 'company_name': "A Co", 'hourly_rate': 80.0},
+            {'contact_name': "Ben", 'company_name': "", 'hourly_rate': 90.0,
+             'track_activity': False, 'retainer_settings': {'enabled': True, 'hours': 10}},
+        ])
+        assert count == 2
+
+        clients = {c['contact_name']: c for c in db.get_clients()}
+        assert clients["Ann"]['hourly_rate'] == 80.0
+        assert clients["Ann"]['track_activity'] == 1
+        assert clients["Ben"]['track_activity'] == 0
+        assert clients["Ben"]['retainer_hours'] == 10
+
+    def test_transaction_rolls_back_on_error(self, temp_db):
+        """Test that a failing tx() block leaves no partial writes."""
+        with pytest.raises(RuntimeError):
+            with db.tx() as conn:
+                db.save_client("Never Saved", "", 50.0, conn=conn)
+                raise RuntimeError("abort import")
+
+        assert db.get_clients() == []
+
+    def test_transaction_refuses_pending_writes(self, temp_db):
+        """Test tx() raises instead of absorbing another caller's open transaction."""
+        conn = db.get_connection()
+        conn.execute("INSERT INTO settings (key, value) VALUES ('pending', '1')")
+
+        with pytest.raises(RuntimeError):
+            with db.tx():
+                pass
+
+        # The pending write is untouched; its owner still decides its fate
+        assert conn.in_transaction
+        conn.rollback()
+        with db.tx() as conn:
+            db.save_client("Saved", "", 50.0, conn=conn)
+        assert len(db.get_clients()) == 1
+
     def test_toggle_favorite(self, temp_db):
         """Test toggling client favorite status."""
         client_id = db.save_client("Test", "", 100.0)
@@ -111,6 +334,22 @@ class TestClients:
         clients = db.get_clients(include_archived=True)
         assert len(clients) == 1
 
+    def test_unarchive_client(self, temp_db):
+        """Test restoring an archived client."""
+        client_id = db.save_client("Test", "", 100.0)
+        assert db.archive_client(client_id) is True
+        assert db.unarchive_client(client_id) is True
+        assert len(db.get_clients()) == 1
+
+    def test_archive_missing_client(self, temp_db):
+        """Test archiving an unknown client reports nothing changed."""
+        assert db.archive_client(9999) is False
+
+    def test_toggle_favorite_missing_client(self, temp_db):
+        """Test toggling favorite on an unknown client raises."""
+        with pytest.raises(ValueError):
+            db.toggle_client_favorite(9999)
+
     def test_delete_client_no_entries(self, temp_db):
         """Test deleting client with no time entries."""
         client_id = db.save_client("Test", "", 100.0)
@@ -126,11 +365,55 @@ class TestClients:
 
         with pytest.raises(ValueError):
             db.delete_client(client_id)
+        assert not db.get_connection().in_transaction
+
+    def test_delete_missing_client(self, temp_db):
+        """Test deleting an unknown client raises and releases the write lock."""
+        with pytest.raises(ValueError, match="not found"):
+            db.delete_client(9999)
+        assert not db.get_connection().in_transaction
+
+    def test_client_billing_round_trip(self, temp_db):
+        """Test billing fields saved by update_client_billing read back."""
+        client_id = db.save_client("Contact", "Company", 100.0)
+        db.update_client_billing(client_id, "AP Dept", "1 Main St", "Suite 2",
+                                 "Austin", "TX", "78701", "ap@example.com", "ACH")
+
+        billing = db.get_client_billing(client_id)
+        assert billing['company_name'] == "Company"
+        assert billing['bill_to'] == "AP Dept"
+        assert billing['address2'] == "Suite 2"
+        assert billing['zip'] == "78701"
+        assert db.get_client_billing(client_id + 1) is None
 
 
 class TestTimeEntries:
     """Test time entry operations."""
 
+    def test_mark_entries_invoiced(self, temp_db):
+        """Test marking a batch of entries without touching the rest."""
+        client_id = db.save_client("Test", "", 100.0)
+        entry_ids = [db.save_time_entry(client_id, datetime.now(), duration_seconds=60)
+                     for _ in range(3)]
+
+        db.mark_entries_invoiced(entry_ids[:2], 'INV-0001')
+
+        assert db.get_time_entry(entry_ids[0])['invoice_number'] == 'INV-0001'
+        assert db.get_time_entry(entry_ids[1])['invoiced'] == 1
+        assert db.get_time_entry(entry_ids[2])['invoiced'] == 0
+
+    def test_first_uninvoiced_date(self, temp_db):
+        """Test the earliest uninvoiced entry's date, skipping invoiced ones."""
+        client_id = db.save_client("Test", "", 100.0)
+        other_id = db.save_client("Other", "", 100.0)
+        billed = db.save_time_entry(client_id, datetime(2025, 1, 2, 23, 30), duration_seconds=60)
+        db.save_time_entry(client_id, datetime(2025, 1, 5, 9, 0), duration_seconds=60)
+        db.save_time_entry(other_id, datetime(2025, 1, 3, 9, 0), duration_seconds=60)
+        db.mark_entries_invoiced([billed], 'INV-0001')
+
+        assert db.get_first_uninvoiced_date(client_id) == '2025-01-05'
+        assert db.get_first_uninvoiced_date() == '2025-01-03'
+
     def test_save_time_entry(self, temp_db):
         """Test saving a time entry."""
         client_id = db.save_client("Test", "", 100.0)
@@ -193,6 +476,10 @@ class TestTimeEntries:
         entry = db.get_time_entry(entry_id)
         assert entry is None
 
+    def test_delete_missing_time_entry(self, temp_db):
+        """Test deleting an entry that doesn't exist."""
+        assert db.delete_time_entry(9999) is False
+
     def test_delete_invoiced_entry_fails(self, temp_db):
         """Test that deleting invoiced entry raises error."""
         client_id = db.save_client("Test", "", 100.0)
@@ -204,6 +491,19 @@ class TestTimeEntries:
         with pytest.raises(ValueError):
             db.delete_time_entry(entry_id)
 
+    def test_failed_delete_leaves_no_open_transaction(self, temp_db):
+        """Test a refused or missing delete doesn't hold the write lock."""
+        client_id = db.save_client("Test", "", 100.0)
+        entry_id = db.save_time_entry(client_id, datetime.now(), duration_seconds=3600)
+        db.mark_entries_invoiced([entry_id], "INV-0001")
+
+        with pytest.raises(ValueError):
+            db.delete_time_entry(entry_id)
+        assert not db.get_connection().in_transaction
+
+        assert db.delete_time_entry(9999) is False
+        assert not db.get_connection().in_transaction
+
     def test_get_time_entries_filtered(self, temp_db):
         """Test filtering time entries."""
         client_id = db.save_client("Test", "", 100.0)
@@ -290,6 +590,121 @@ class TestTimeSummary:
         assert summary['invoiced_hours'] == 0  # Paid invoices don't count as "invoiced"
         assert summary['paid_hours'] == 5.0
 
+    def test_client_summary_amounts_with_multiple_hour_rows(self, temp_db):
+        """Test invoice totals aren't multiplied by their hour rows."""
+        client_id = db.save_client("Test", "", 100.0)
+        other_id = db.save_client("Other", "", 100.0)
+
+        conn = db.get_connection()
+        for number, cid, status in [('INV-0001', client_id, 'unpaid'),
+                                    ('INV-0002', client_id, 'paid'),
+                                    ('INV-0003', other_id, 'unpaid')]:
+            conn.execute("""
+                INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                      description, billing_type, rate, total,
+                                      payment_terms, payment_method, status)
+                VALUES (?, ?, '2025-01-01', '2025-01-31', 'Test', 'hourly', 100, 300,
+                        'Net 30', 'ACH', ?)
+            """, (number, cid, status))
+            conn.executemany(
+                "INSERT INTO invoice_hours (invoice_number, work_date, hours) VALUES (?, ?, 1.5)",
+                [(number, '2025-01-01'), (number, '2025-01-02')])
+        conn.commit()
+
+        summary = db.get_time_summary(client_id)
+        assert summary['invoiced_hours'] == 3.0
+        assert summary['paid_hours'] == 3.0
+        assert summary['invoiced_amount'] == 300
+        assert summary['paid_amount'] == 300
+
+        summary = db.get_global_time_summary()
+        assert summary['invoiced_hours'] == 6.0
+        assert summary['invoiced_amount'] == 600
+
+    def test_summary_cache_sees_writes(self, temp_db):
+        """Test cached summaries refresh after any write, even raw SQL."""
+        client_id = db.save_client("Test", "", 100.0)
+        db.save_time_entry(client_id, datetime.now(), duration_seconds=3600)
+
+        summary = db.get_global_time_summary()
+        summary['uninvoiced_hours'] = 99  # callers get their own copy
+        assert db.get_global_time_summary()['uninvoiced_hours'] == 1.0
+
+        conn = db.get_connection()
+        conn.execute("UPDATE time_entries SET duration_seconds = 7200")
+        conn.commit()
+        assert db.get_global_time_summary()['uninvoiced_hours'] == 2.0
+
+    def test_summary_cache_ignores_rolled_back_reads(self, temp_db):
+        """Test a read inside a rolled-back tx() isn't served afterwards."""
+        client_id = db.save_client("Test", "", 100.0)
+        assert db.get_global_time_summary()['uninvoiced_hours'] == 0.0
+
+        with pytest.raises(RuntimeError):
+            with db.tx() as conn:
+                conn.execute("""
+                    INSERT INTO time_entries (client_id, start_time, duration_seconds, created_at)
+                    VALUES (?, ?, 3600, ?)
+                """, (client_id, datetime.now().isoformat(), datetime.now().isoformat()))
+                assert db.get_global_time_summary()['uninvoiced_hours'] == 1.0
+                raise RuntimeError("abort")
+
+        assert db.get_global_time_summary()['uninvoiced_hours'] == 0.0
+
+    def test_invoice_cache_ignores_rolled_back_reads(self, temp_db):
+        """Test an invoice read before close() rolls it back isn't served afterwards."""
+        client_id = db.save_client("Test", "", 100.0)
+        conn = db.get_connection()
+        conn.execute("""
+            INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                  description, billing_type, rate, quantity, total,
+                                  payment_terms, payment_method, status)
+            VALUES ('INV-0001', ?, '2025-01-01', '2025-01-31', 'Work', 'hourly', 100, 1, 100,
+                    'Net 30', 'ACH', 'unpaid')
+        """, (client_id,))
+        assert db.get_invoice('INV-0001') is not None
+
+        conn.close()
+
+        assert db.get_invoice('INV-0001') is None
+
+    def test_client_stats_follow_invoice_changes(self, temp_db):
+        """Test the client_stats rollup tracks payment, hours edits and deletes."""
+        client_id = db.save_client("Test", "", 100.0)
+
+        conn = db.get_connection()
+        conn.execute("""
+            INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                  description, billing_type, rate, total,
+                                  payment_terms, payment_method, status)
+            VALUES ('INV-0001', ?, '2025-01-01', '2025-01-31', 'Test', 'hourly', 100, 200,
+                    'Net 30', 'ACH', 'unpaid')
+        """, (client_id,))
+        conn.execute("""
+            INSERT INTO invoice_hours (invoice_number, work_date, hours)
+            VALUES ('INV-0001', '2025-01-01', 2.0)
+        """)
+        conn.commit()
+
+        def stats():
+            row = conn.execute(
+                "SELECT invoiced_hours, paid_hours, invoiced_amount, paid_amount "
+                "FROM client_stats WHERE client_id = ?", (client_id,)).fetchone()
+            return tuple(row)
+
+        assert stats() == (2.0, 0, 200, 0)
+
+        db.record_payment('INV-0001', 200, '2025-02-01')
+        assert stats() == (0, 2.0, 0, 200)
+
+        conn.execute("UPDATE invoice_hours SET hours = 3.0")
+        conn.commit()
+        assert db.get_time_summary(client_id)['paid_hours'] == 3.0
+
+        conn.execute("DELETE FROM invoices")
+        conn.commit()
+        assert stats() == (0, 0, 0, 0)
+
     def test_global_summary(self, temp_db):
         """Test global summary across all clients."""
         client1 = db.save_client("Client 1", "", 100.0)
@@ -365,6 +780,31 @@ class TestInvoices:
         assert invoice['status'] == 'paid'
         assert invoice['amount_paid'] == 500
 
+    def test_record_payment_date_paid(self, temp_db):
+        """Test date_paid is set within a cent of the total and cleared by a reversal."""
+        client_id = db.save_client("Test", "", 100.0)
+        conn = db.get_connection()
+        conn.execute("""
+            INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                  description, billing_type, rate, total,
+                                  payment_terms, payment_method, status)
+            VALUES ('INV-0001', ?, '2025-01-01', '2025-01-31', 'Test', 'hourly', 100, 500,
+                    'Net 30', 'ACH', 'unpaid')
+        """, (client_id,))
+        conn.commit()
+
+        db.record_payment('INV-0001', 499.995, '2025-02-01')
+        invoice = db.get_invoice('INV-0001')
+        assert invoice['status'] == 'paid'
+        assert invoice['date_paid'] == '2025-02-01'
+
+        db.record_payment('INV-0001', -499.995)
+        invoice = db.get_invoice('INV-0001')
+        assert invoice['status'] == 'unpaid'
+        assert invoice['date_paid'] is None
+
+        db.record_payment('INV-9999', 100)  # Unknown invoice is a no-op
+
 
 class TestActiveTimer:
     """Test active timer (crash recovery) operations."""
@@ -391,6 +831,15 @@ class TestActiveTimer:
         active = db.get_active_timer()
         assert active['accumulated_seconds'] == 7200
 
+    def test_active_timer_save_time_is_local_iso(self, temp_db):
+        """Test that SQLite-stamped save times parse as local datetimes."""
+        client_id = db.save_client("Test", "", 100.0)
+        db.save_active_timer(client_id, datetime.now(), 0)
+        db.update_active_timer(60)
+
+        saved = datetime.fromisoformat(db.get_active_timer()['last_save_time'])
+        assert abs((datetime.now() - saved).total_seconds()) < 5
+
     def test_clear_active_timer(self, temp_db):
         """Test clearing active timer."""
         client_id = db.save_client("Test", "", 100.0)
@@ -402,6 +851,31 @@ class TestActiveTimer:
         assert active is None
 
 
+class TestScreenshots:
+    """Test screenshot records."""
+
+    def test_cleanup_paid_invoice_screenshots(self, temp_db):
+        """Test that only the invoice's screenshots and files are removed."""
+        client_id = db.save_client("Test", "", 100.0)
+        billed = db.save_time_entry(client_id, datetime.now(), duration_seconds=60)
+        unbilled = db.save_time_entry(client_id, datetime.now(), duration_seconds=60)
+        db.mark_entries_invoiced([billed], 'INV-0001')
+
+        files = []
+        for entry_id in (billed, unbilled):
+            path = Path(temp_db) / f"shot_{entry_id}.png"
+            path.write_bytes(b"png")
+            files.append(path)
+            db.link_screenshots_to_entry([db.save_screenshot(client_id, str(path))], entry_id)
+
+        db.cleanup_paid_invoice_screenshots('INV-0001')
+
+        assert not files[0].exists()
+        assert files[1].exists()
+        remaining = db.get_connection().execute("SELECT time_entry_id FROM screenshots").fetchall()
+        assert [row[0] for row in remaining] == [unbilled]
+
+
 class TestTaxYearSummary:
     """Test tax year summary for income reporting."""
 
@@ -476,6 +950,27 @@ class TestTaxYearSummary:
         # Should be $1000 + $500 = $1500
         assert summary['total_income'] == 1500
 
+    def test_tax_summary_quarters(self, temp_db):
+        """Payments land in the quarter of their payment date."""
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+
+        conn = db.get_connection()
+        for number, amount, date_paid in [('INV-0001', 100, '2025-03-31'),
+                                          ('INV-0002', 200, '2025-04-01'),
+                                          ('INV-0003', 300, '2025-12-31'),
+                                          ('INV-0004', 400, '2024-12-31')]:
+            conn.execute("""
+                INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                      description, billing_type, rate, total,
+                                      payment_terms, payment_method, status, amount_paid, date_paid)
+                VALUES (?, ?, '2025-01-01', '2025-01-31', 'Test', 'hourly', 100, ?,
+                        'Net 30', 'ACH', 'paid', ?, ?)
+            """, (number, client_id, amount, amount, date_paid))
+        conn.commit()
+
+        summary = db.get_tax_year_summary(2025)
+        assert summary['quarters'] == {'q1': 100, 'q2': 200, 'q3': 0, 'q4': 300}
+
 
 class TestOutstandingBalance:
     """Test outstanding balance tracking for invoices."""
@@ -556,6 +1051,28 @@ class TestOutstandingBalance:
         assert invoices[0]['invoice_number'] == 'INV-0001'
         assert invoices[0]['outstanding'] == 1500
 
+    def test_outstanding_invoices_days_overdue(self, temp_db):
+        """Test days overdue is counted from today's local date."""
+        client_id = db.save_client("Test", "", 100.0)
+        today = datetime.now().date()
+
+        conn = db.get_connection()
+        for number, due in [('INV-0001', today - timedelta(days=3)),
+                            ('INV-0002', today),
+                            ('INV-0003', today + timedelta(days=10))]:
+            conn.execute("""
+                INSERT INTO invoices (invoice_number, client_id, date_issued, due_date,
+                                      description, billing_type, rate, total,
+                                      payment_terms, payment_method, status)
+                VALUES (?, ?, '2025-01-01', ?, 'Test', 'hourly', 100, 100,
+                        'Net 30', 'ACH', 'unpaid')
+            """, (number, client_id, due.isoformat()))
+        conn.commit()
+
+        invoices = db.get_outstanding_invoices(client_id)
+        overdue = {inv['invoice_number']: inv['days_overdue'] for inv in invoices}
+        assert overdue == {'INV-0001': 3, 'INV-0002': 0, 'INV-0003': -10}
+
 
 class TestSettings:
     """Test settings operations."""
@@ -571,11 +1088,36 @@ class TestSettings:
         value = db.get_setting('custom_key')
         assert value == 'custom_value'
 
+    def test_get_settings_multiple_keys(self, temp_db):
+        """Test fetching several settings at once."""
+        db.set_setting('s3_bucket', 'my-bucket')
+        db.set_setting('s3_region', 'us-east-1')
+        values = db.get_settings(['s3_bucket', 's3_region', 's3_missing'])
+        assert values == {'s3_bucket': 'my-bucket', 's3_region': 'us-east-1'}
+
     def test_get_nonexistent_setting(self, temp_db):
         """Test getting nonexistent setting returns default."""
         value = db.get_setting('nonexistent', 'default')
         assert value == 'default'
 
+    def test_cached_config_refreshes_after_save(self, temp_db):
+        """Test repeated reads hit the cache and saves replace the cached value."""
+        db.set_setting('theme', 'dark')
+        assert db.get_setting('theme') == 'dark'
+        hits = db.config_cache_stats['hits']
+        assert db.get_setting('theme') == 'dark'
+        assert db.config_cache_stats['hits'] == hits + 1
+
+        db.set_setting('theme', 'light')
+        assert db.get_setting('theme') == 'light'
+
+        assert db.get_banking() is None
+        db.save_banking({'bank_name': 'First Bank', 'routing_number': '1',
+                         'account_number': '2'})
+        banking = db.get_banking()
+        banking['bank_name'] = 'changed'  # callers get their own copy
+        assert db.get_banking()['bank_name'] == 'First Bank'
+
 
 class TestRetainerBilling:
     """Test retainer billing functionality."""
@@ -1328,6 +1870,24 @@ class TestCountWeeksInEntries:
         count, period_start, period_end = db.count_weeks_in_entries(entries)
         assert count == 1
 
+    def test_saved_entries(self, temp_db):
+        """Entries read back from the database count by their start date."""
+        client_id = db.save_client("Test", "Test Co", 100.0)
+        db.save_time_entry(client_id, datetime(2025, 1, 26, 23, 30, 0), duration_seconds=600)  # Sunday
+        db.save_time_entry(client_id, datetime(2025, 1, 27, 0, 15, 0), duration_seconds=600)  # Monday
+        entries = db.get_time_entries(client_id=client_id)
+        assert db.count_weeks_in_entries(entries) == (2, '2025-01-20', '2025-02-02')
+
+
+class TestFormatDateDisplay:
+    """Test display formatting of ISO dates."""
+
+    def test_matches_strftime(self):
+        """Output matches the long-form strftime rendering."""
+        for iso in ['2025-01-05', '2025-09-30', '2024-12-31T23:59:00']:
+            expected = datetime.fromisoformat(iso).strftime("%B %d, %Y")
+            assert db.format_date_display(iso) == expected
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -33,6 +33,93 @@ def temp_db():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+class TestInvoiceNumbering:
+    """Test invoice numbers assigned at creation."""
+
+    def test_sequential_invoice_numbers(self, temp_db):
+        """Each created invoice takes the next number."""
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+        client = db.get_client(client_id)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 9, 0, 0), duration_seconds=3600)
+        entries = db.get_time_entries(client_id=client_id, invoiced=False)
+
+        numbers = [invoice_bridge.create_invoice(client, entries, "Work", "Net 30", "ACH")['invoice_number']
+                   for _ in range(2)]
+
+        assert numbers == ['INV-0001', 'INV-0002']
+        assert db.get_next_invoice_number() == 'INV-0003'
+
+    def test_hours_grouped_by_work_date(self, temp_db):
+        """Entries on the same day collapse into one invoice_hours row."""
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+        client = db.get_client(client_id)
+        db.save_time_entry(client_id, datetime(2025, 1, 21, 9, 0, 0), duration_seconds=5400)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 9, 0, 0), duration_seconds=3600)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 14, 0, 0), duration_seconds=1800)
+        entries = db.get_time_entries(client_id=client_id, invoiced=False)
+
+        result = invoice_bridge.create_invoice(client, entries, "Work", "Net 30", "ACH")
+
+        assert [(h['work_date'], h['hours']) for h in db.get_invoice_hours(result['invoice_number'])] == [
+            ('2025-01-20', 1.5), ('2025-01-21', 1.5)]
+
+    def test_background_pdf_returns_future(self, temp_db):
+        """background_pdf hands back a future instead of rendering inline."""
+        pytest.importorskip('reportlab')
+        db.save_business_info({
+            'company_name': 'Test LLC', 'owner_name': 'Test Owner',
+            'address': '123 Test St', 'city': 'Testville', 'state': 'TX',
+            'zip': '75001', 'phone': '555-0100', 'email': 'test@test.com',
+            'ein': '12-3456789',
+        })
+        db.save_banking({'bank_name': 'Test Bank', 'routing_number': '111000025',
+                         'account_number': '123456789'})
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+        client = db.get_client(client_id)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 9, 0, 0), duration_seconds=3600)
+        entries = db.get_time_entries(client_id=client_id, invoiced=False)
+
+        result = invoice_bridge.create_invoice(client, entries, "Work", "Net 30", "ACH",
+                                               background_pdf=True)
+
+        assert 'pdf_path' not in result
+        pdf_path = result['pdf_future'].result(timeout=30)
+        assert Path(pdf_path).exists()
+
+    def test_background_pdf_error_in_future(self, temp_db):
+        """A failed background render surfaces through the future."""
+        pytest.importorskip('reportlab')
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+        client = db.get_client(client_id)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 9, 0, 0), duration_seconds=3600)
+        entries = db.get_time_entries(client_id=client_id, invoiced=False)
+
+        # No business info saved, so the PDF can't be rendered
+        result = invoice_bridge.create_invoice(client, entries, "Work", "Net 30", "ACH",
+                                               background_pdf=True)
+
+        assert result['success'] is True
+        error = result['pdf_future'].exception(timeout=30)
+        assert "Business info not configured" in str(error)
+
+    def test_failed_hours_insert_rolls_back_invoice(self, temp_db):
+        """The invoice row and its daily hours commit together or not at all."""
+        client_id = db.save_client("Test Client", "Test Co", 100.0)
+        client = db.get_client(client_id)
+        db.save_time_entry(client_id, datetime(2025, 1, 20, 9, 0, 0), duration_seconds=3600)
+        entries = db.get_time_entries(client_id=client_id, invoiced=False)
+        db.get_connection().execute("""
+            CREATE TEMP TRIGGER fail_hours BEFORE INSERT ON invoice_hours
+            BEGIN SELECT RAISE(ABORT, 'disk full'); END
+        """)
+
+        result = invoice_bridge.create_invoice(client, entries, "Work", "Net 30", "ACH")
+
+        assert result == {'success': False, 'error': 'disk full'}
+        assert db.get_invoices() == []
+        assert db.get_next_invoice_number() == 'INV-0001'
+
+
 class TestRetainerInvoiceCreation:
     """Test retainer invoice creation."""
 
@@ -4,6 +4,7 @@ import ctypes
 import random
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Callable, List
 import db
 
@@ -214,7 +215,7 @@ class ScreenshotCapture:
 
             if push_remote:
                 from screenshot_upload import upload_screenshot
-                success = upload_screenshot(self.client_id, filepath)
+                success = upload_screenshot(self.client_id, filepath, client)
                 # Delete local if push succeeded AND keep_local is off
                 if success and not keep_local:
                     try:
@@ -460,6 +461,7 @@ def format_hours(hours: float) -> str:
     return f"{hours:.2f} hrs"
 
 
+@lru_cache(maxsize=4096)
 def format_currency(amount: float) -> str:
-    """Format amount as currency."""
+    """Format amount as currency. Memoized; the summary panel redraws the same amounts."""
     return f"${amount:,.2f}"
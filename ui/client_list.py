@@ -468,6 +468,7 @@ class ClientListPanel(ttk.Frame):
         """Create the invoice."""
         try:
             import invoice_bridge
+            from ui.dialogs import watch_invoice_pdf
             result = invoice_bridge.create_invoice(
                 client,
                 invoice_data['entries'],
@@ -476,6 +477,7 @@ class ClientListPanel(ttk.Frame):
                 invoice_data['payment_method'],
                 retainer_info=invoice_data.get('retainer_info'),
                 weekly_flat_rate_info=invoice_data.get('weekly_flat_rate_info'),
+                background_pdf=True,
             )
 
             if result['success']:
@@ -483,11 +485,7 @@ class ClientListPanel(ttk.Frame):
                 entry_ids = [e['id'] for e in invoice_data['entries']]
                 db.mark_entries_invoiced(entry_ids, result['invoice_number'])
 
-                messagebox.showinfo(
-                    "Invoice Created",
-                    f"Invoice {result['invoice_number']} created.\n\nPDF: {result.get('pdf_path', 'N/A')}",
-                    parent=self
-                )
+                watch_invoice_pdf(self, result['invoice_number'], result['pdf_future'])
             else:
                 messagebox.showerror("Error", f"Failed to create invoice:\n{result.get('error', 'Unknown error')}", parent=self)
 
@@ -691,6 +691,33 @@ class BuildInvoiceDialog(tk.Toplevel):
         self.destroy()
 
 
+def watch_invoice_pdf(parent, invoice_number: str, future):
+    """Poll a background invoice PDF render from the Tk thread, then report it.
+
+    Stops quietly if parent is destroyed before the render finishes.
+    """
+    if not parent.winfo_exists():
+        return
+    if not future.done():
+        parent.after(100, watch_invoice_pdf, parent, invoice_number, future)
+        return
+
+    error = future.exception()
+    if error is not None:
+        messagebox.showerror(
+            "PDF Error",
+            f"Invoice {invoice_number} created, but its PDF could not be generated:\n{error}",
+            parent=parent
+        )
+        return
+
+    messagebox.showinfo(
+        "Invoice Created",
+        f"Invoice {invoice_number} created.\n\nPDF: {future.result() or 'N/A'}",
+        parent=parent
+    )
+
+
 class IdleDialog(tk.Toplevel):
     """Dialog shown when idle timeout is triggered."""
 
@@ -8,7 +8,7 @@ import timer_engine
 from ui.client_list import ClientListPanel
 from ui.timer_display import TimerDisplayPanel
 from ui.time_summary import TimeSummaryPanel
-from ui.dialogs import ManualEntryDialog, BuildInvoiceDialog, RecoveryDialog, SettingsDialog, BusinessSetupDialog, InvoiceListDialog, TimeEntriesDialog, TaxYearSummaryDialog
+from ui.dialogs import ManualEntryDialog, BuildInvoiceDialog, RecoveryDialog, SettingsDialog, BusinessSetupDialog, InvoiceListDialog, TimeEntriesDialog, TaxYearSummaryDialog, watch_invoice_pdf
 import os
 import subprocess
 import sys
@@ -297,6 +297,7 @@ class MainWindow(ttk.Frame):
                 invoice_data['payment_method'],
                 retainer_info=invoice_data.get('retainer_info'),
                 weekly_flat_rate_info=invoice_data.get('weekly_flat_rate_info'),
+                background_pdf=True,
             )
 
             if result['success']:
@@ -305,11 +306,7 @@ class MainWindow(ttk.Frame):
                 db.mark_entries_invoiced(entry_ids, result['invoice_number'])
 
                 self._refresh_summary()
-                messagebox.showinfo(
-                    "Invoice Created",
-                    f"Invoice {result['invoice_number']} created.\n\nPDF: {result.get('pdf_path', 'N/A')}",
-                    parent=self
-                )
+                watch_invoice_pdf(self, result['invoice_number'], result['pdf_future'])
             else:
                 messagebox.showerror("Error", f"Failed to create invoice:\n{result.get('error', 'Unknown error')}", parent=self)
 